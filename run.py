@@ -25,6 +25,11 @@ import sys
 import time
 import math
 import argparse
+import bisect
+import collections
+import functools
+import itertools
+from array import array
 import os
 import signal
 import random
@@ -51,8 +56,12 @@ class Vec3:
         return self.x * other.x + self.y * other.y + self.z * other.z
 
     def normalize(self) -> 'Vec3':
-        l = math.sqrt(self.x**2 + self.y**2 + self.z**2)
-        return Vec3(self.x / l, self.y / l, self.z / l) if l > 0 else Vec3(0, 0, 0)
+        x, y, z = self.x, self.y, self.z
+        l2 = x * x + y * y + z * z
+        if l2 > 0:
+            inv = 1.0 / math.sqrt(l2)
+            return Vec3(x * inv, y * inv, z * inv)
+        return Vec3(0, 0, 0)
 
 
 class Quaternion:
@@ -66,11 +75,33 @@ class Quaternion:
         self.z = z
 
     @staticmethod
-    def from_axis_angle(axis: Vec3, angle: float) -> 'Quaternion':
+    def from_axis_angle(axis: Vec3, angle: float,
+                        _sin=math.sin, _cos=math.cos) -> 'Quaternion':
         """Create a quaternion from an axis-angle rotation"""
         half = angle * 0.5
-        s = math.sin(half)
-        return Quaternion(math.cos(half), axis.x * s, axis.y * s, axis.z * s)
+        s = _sin(half)
+        return Quaternion(_cos(half), axis.x * s, axis.y * s, axis.z * s)
+
+    @staticmethod
+    def from_euler(angle_x: float, angle_y: float, angle_z: float,
+                   _sin=math.sin, _cos=math.cos) -> 'Quaternion':
+        """Closed-form qz * qx * qy — rotate about Y, then X, then Z.
+
+        Equivalent to composing the three axis-angle quaternions in that
+        order, without the two intermediate Hamilton products.
+        """
+        hx, hy, hz = angle_x * 0.5, angle_y * 0.5, angle_z * 0.5
+        cx, sx = _cos(hx), _sin(hx)
+        cy, sy = _cos(hy), _sin(hy)
+        cz, sz = _cos(hz), _sin(hz)
+        cxcy, sxsy = cx * cy, sx * sy
+        sxcy, cxsy = sx * cy, cx * sy
+        return Quaternion(
+            cz * cxcy - sz * sxsy,
+            cz * sxcy - sz * cxsy,
+            cz * cxsy + sz * sxcy,
+            cz * sxsy + sz * cxcy,
+        )
 
     @staticmethod
     def identity() -> 'Quaternion':
@@ -85,9 +116,32 @@ class Quaternion:
             self.w * other.z + self.x * other.y - self.y * other.x + self.z * other.w,
         )
 
+    # Single-axis rotations (c, s·axis) have two zero components, so the
+    # Hamilton product (axis quaternion) * self collapses to 8 products.
+    # Each matches multiply() term for term with the zero products dropped.
+
+    def premul_x(self, c: float, s: float) -> 'Quaternion':
+        """(c, s, 0, 0) * self — rotate about X by the half-angle (c, s)."""
+        w, x, y, z = self.w, self.x, self.y, self.z
+        return Quaternion(c * w - s * x, c * x + s * w,
+                          c * y - s * z, c * z + s * y)
+
+    def premul_y(self, c: float, s: float) -> 'Quaternion':
+        """(c, 0, s, 0) * self — rotate about Y by the half-angle (c, s)."""
+        w, x, y, z = self.w, self.x, self.y, self.z
+        return Quaternion(c * w - s * y, c * x + s * z,
+                          c * y + s * w, c * z - s * x)
+
+    def premul_z(self, c: float, s: float) -> 'Quaternion':
+        """(c, 0, 0, s) * self — rotate about Z by the half-angle (c, s)."""
+        w, x, y, z = self.w, self.x, self.y, self.z
+        return Quaternion(c * w - s * z, c * x - s * y,
+                          c * y + s * x, c * z + s * w)
+
     def normalize(self) -> 'Quaternion':
         """Re-normalize to unit quaternion (counteracts floating-point drift)"""
-        n = math.sqrt(self.w**2 + self.x**2 + self.y**2 + self.z**2)
+        w, x, y, z = self.w, self.x, self.y, self.z
+        n = math.sqrt(w * w + x * x + y * y + z * z)
         if n > 0:
             inv = 1.0 / n
             self.w *= inv
@@ -108,6 +162,64 @@ class Quaternion:
             v.z + qw * tz + (qx * ty - qy * tx),
         )
 
+    def to_matrix(self) -> tuple:
+        """Row-major 3×3 rotation matrix equivalent to rotate_vector.
+
+        Lets a whole vertex batch be rotated with 9 multiplies per vertex
+        instead of re-deriving the cross products for each one.
+        """
+        w, x, y, z = self.w, self.x, self.y, self.z
+        x2, y2, z2 = x + x, y + y, z + z
+        xx, yy, zz = x * x2, y * y2, z * z2
+        xy, xz, yz = x * y2, x * z2, y * z2
+        wx, wy, wz = w * x2, w * y2, w * z2
+        return (
+            1.0 - yy - zz, xy - wz,       xz + wy,
+            xy + wz,       1.0 - xx - zz, yz - wx,
+            xz - wy,       yz + wx,       1.0 - xx - yy,
+        )
+
+
+def _face_center(vs: list) -> Vec3:
+    """Centroid of a polygon of Vec3 (unrolled for triangles and quads)."""
+    n = len(vs)
+    if n == 4:
+        a, b, c, d = vs
+        return Vec3((a.x + b.x + c.x + d.x) / 4,
+                    (a.y + b.y + c.y + d.y) / 4,
+                    (a.z + b.z + c.z + d.z) / 4)
+    if n == 3:
+        a, b, c = vs
+        return Vec3((a.x + b.x + c.x) / 3,
+                    (a.y + b.y + c.y) / 3,
+                    (a.z + b.z + c.z) / 3)
+    return Vec3(sum(v.x for v in vs) / n,
+                sum(v.y for v in vs) / n,
+                sum(v.z for v in vs) / n)
+
+
+def _face_center_normal(vs: list, _sqrt=math.sqrt) -> tuple:
+    """Return (centroid, unit outward normal) for a polygon of Vec3.
+
+    The normal is e2 × e1 (last-edge × first-edge from v0).  All math runs
+    on plain floats; only the two results are allocated as Vec3.
+    """
+    center = _face_center(vs)
+    a, b, last = vs[0], vs[1], vs[-1]
+    # Outward normal: e2 × e1  (last-edge × first-edge from v0)
+    e1x, e1y, e1z = b.x - a.x, b.y - a.y, b.z - a.z
+    e2x, e2y, e2z = last.x - a.x, last.y - a.y, last.z - a.z
+    nx = e2y * e1z - e2z * e1y
+    ny = e2z * e1x - e2x * e1z
+    nz = e2x * e1y - e2y * e1x
+    l2 = nx * nx + ny * ny + nz * nz
+    if l2 > 0:
+        inv = 1.0 / _sqrt(l2)
+        normal = Vec3(nx * inv, ny * inv, nz * inv)
+    else:
+        normal = Vec3(0, 0, 0)
+    return center, normal
+
 
 # ---------------------------------------------------------------------------
 # Camera — first-person with yaw/pitch orientation
@@ -132,18 +244,18 @@ class Camera:
 
     # -- orientation vectors -------------------------------------------------
 
-    def _update_vectors(self):
-        cy, sy = math.cos(self.yaw), math.sin(self.yaw)
-        cp, sp = math.cos(self.pitch), math.sin(self.pitch)
+    def _update_vectors(self, _sin=math.sin, _cos=math.cos):
+        cy, sy = _cos(self.yaw), _sin(self.yaw)
+        cp, sp = _cos(self.pitch), _sin(self.pitch)
         self.forward = Vec3(sy * cp, sp, -cy * cp)
         self.right   = Vec3(cy, 0.0, sy)
         self.up      = Vec3(-sy * sp, cp, cy * sp)
 
     # -- movement ------------------------------------------------------------
 
-    def move_forward(self, dist: float):
+    def move_forward(self, dist: float, _sin=math.sin, _cos=math.cos):
         """Move along the *horizontal* forward direction (pitch ignored)."""
-        cy, sy = math.cos(self.yaw), math.sin(self.yaw)
+        cy, sy = _cos(self.yaw), _sin(self.yaw)
         self.position.x += sy * dist
         self.position.z -= cy * dist
 
@@ -155,8 +267,12 @@ class Camera:
         self.position.y += dist
 
     def turn(self, dyaw: float, dpitch: float = 0.0):
+        p = self.pitch + dpitch
+        p = 1.3 if p > 1.3 else (-1.3 if p < -1.3 else p)
+        if not dyaw and p == self.pitch:
+            return              # no-op (e.g. pitch already at its limit)
         self.yaw += dyaw
-        self.pitch = max(-1.3, min(1.3, self.pitch + dpitch))
+        self.pitch = p
         self._update_vectors()
 
     # -- transforms ----------------------------------------------------------
@@ -199,33 +315,82 @@ class Model:
         vertices : list[Vec3] — vertex positions (copied internally)
         faces    : list[tuple[int,...]] — per-face vertex index tuples (len 3 or 4)
         """
-        self._original_vertices = [Vec3(v.x, v.y, v.z) for v in vertices]
+        # Model-space reference copy as one flat xyz buffer of C doubles;
+        # only the rotated working set needs to be Vec3 objects.
+        self._original_coords = array(
+            'd', [c for v in vertices for c in (v.x, v.y, v.z)])
         self.FACES = faces
         self.vertices = [Vec3(v.x, v.y, v.z) for v in vertices]
         self._orientation = Quaternion.identity()
+        self._matrix = (1.0, 0.0, 0.0, 0.0, 1.0, 0.0, 0.0, 0.0, 1.0)
         self._frame_count = 0
+        self._face_cache = None           # get_face_data result until rotate()
+        self._delta_key = None            # (angle_x, angle_y, angle_z) ...
+        self._delta = None                # ... and its q -> delta * q step
+
+        # Per-face records as parallel arrays.  Vertex lists alias the live
+        # Vec3s in self.vertices; centres and normals are kept in model
+        # space and only rotated per frame, never re-derived.
+        self._face_verts = [[self.vertices[i] for i in face] for face in faces]
+        self._face_centers = []
+        self._face_normals = []
+        for face in faces:
+            c, n = _face_center_normal([vertices[i] for i in face])
+            self._face_centers.append((c.x, c.y, c.z))
+            self._face_normals.append((n.x, n.y, n.z))
 
     # -- rotation (same for every model) ------------------------------------
 
+    @staticmethod
+    def _make_delta(angle_x: float, angle_y: float, angle_z: float,
+                    _sin=math.sin, _cos=math.cos):
+        """Return a callable q -> (Y, then X, then Z rotation) * q.
+
+        Several axes compose into one from_euler quaternion; a single axis
+        uses the sparse premul_* product on its half-angle cos/sin.
+        """
+        if angle_x and (angle_y or angle_z) or (angle_y and angle_z):
+            return Quaternion.from_euler(angle_x, angle_y, angle_z).multiply
+        if angle_y:
+            premul, half = Quaternion.premul_y, angle_y * 0.5
+        elif angle_x:
+            premul, half = Quaternion.premul_x, angle_x * 0.5
+        else:
+            premul, half = Quaternion.premul_z, angle_z * 0.5
+        return functools.partial(premul, c=_cos(half), s=_sin(half))
+
     def rotate(self, angle_x: float = 0, angle_y: float = 0,
                angle_z: float = 0) -> None:
-        """Quaternion-composed rotation — drift-free and gimbal-lock-free."""
-        if angle_y:
-            qy = Quaternion.from_axis_angle(Vec3(0, 1, 0), angle_y)
-            self._orientation = qy.multiply(self._orientation)
-        if angle_x:
-            qx = Quaternion.from_axis_angle(Vec3(1, 0, 0), angle_x)
-            self._orientation = qx.multiply(self._orientation)
-        if angle_z:
-            qz = Quaternion.from_axis_angle(Vec3(0, 0, 1), angle_z)
-            self._orientation = qz.multiply(self._orientation)
+        """Quaternion-composed rotation — drift-free and gimbal-lock-free.
+
+        A call with all three angles zero is a no-op: the vertices and the
+        cached face data stay valid.  Forest geometry is static world-space
+        face data and never goes through rotate() at all.
+        """
+        if not (angle_x or angle_y or angle_z):
+            return
+
+        # Spin speeds are constant, so the per-frame delta (and its sin /
+        # cos) is only rebuilt when the angles change.
+        key = (angle_x, angle_y, angle_z)
+        if key != self._delta_key:
+            self._delta_key = key
+            self._delta = self._make_delta(angle_x, angle_y, angle_z)
+        self._orientation = self._delta(self._orientation)
 
         self._frame_count += 1
         if self._frame_count % 60 == 0:
             self._orientation.normalize()
 
-        for orig, v in zip(self._original_vertices, self.vertices):
-            v.x, v.y, v.z = self._orientation.rotate_vector(orig)
+        # One matrix per frame, then a flat multiply-add loop over the batch
+        self._matrix = self._orientation.to_matrix()
+        m00, m01, m02, m10, m11, m12, m20, m21, m22 = self._matrix
+        coords = iter(self._original_coords)
+        for v, ox, oy, oz in zip(self.vertices, coords, coords, coords):
+            v.x = m00 * ox + m01 * oy + m02 * oz
+            v.y = m10 * ox + m11 * oy + m12 * oz
+            v.z = m20 * ox + m21 * oy + m22 * oz
+        self._face_cache = None
 
     # -- face data for the renderer -----------------------------------------
 
@@ -235,35 +400,38 @@ class Model:
         *verts*  is a list of 3 or 4 Vec3 (transformed).
         *center* is the centroid Vec3.
         *normal* is the unit outward-normal Vec3.
+
+        The list is cached until the next rotate(), so repeated calls within
+        a frame are free.  Callers must treat it as read-only.
         """
+        if self._face_cache is not None:
+            return self._face_cache
+        # A rigid rotation maps centroids and unit normals straight through
+        # the frame matrix — 18 multiply-adds per face, no cross or sqrt.
+        m00, m01, m02, m10, m11, m12, m20, m21, m22 = self._matrix
         result = []
-        for face in self.FACES:
-            vs = [self.vertices[i] for i in face]
-            n = len(vs)
-            center = Vec3(
-                sum(v.x for v in vs) / n,
-                sum(v.y for v in vs) / n,
-                sum(v.z for v in vs) / n,
-            )
-            # Outward normal: e2 × e1  (last-edge × first-edge from v0)
-            e1 = Vec3(vs[1].x - vs[0].x, vs[1].y - vs[0].y, vs[1].z - vs[0].z)
-            e2 = Vec3(vs[-1].x - vs[0].x, vs[-1].y - vs[0].y, vs[-1].z - vs[0].z)
-            normal = Vec3(
-                e2.y * e1.z - e2.z * e1.y,
-                e2.z * e1.x - e2.x * e1.z,
-                e2.x * e1.y - e2.y * e1.x,
-            ).normalize()
-            result.append((vs, center, normal))
+        append = result.append
+        for vs, (cx, cy, cz), (nx, ny, nz) in zip(
+                self._face_verts, self._face_centers, self._face_normals):
+            append((vs,
+                    Vec3(m00 * cx + m01 * cy + m02 * cz,
+                         m10 * cx + m11 * cy + m12 * cz,
+                         m20 * cx + m21 * cy + m22 * cz),
+                    Vec3(m00 * nx + m01 * ny + m02 * nz,
+                         m10 * nx + m11 * ny + m12 * nz,
+                         m20 * nx + m21 * ny + m22 * nz)))
+        self._face_cache = result
         return result
 
     # -- bounding radius for auto-fit scaling --------------------------------
 
     def bounding_radius(self) -> float:
         """Maximum distance from origin across all original vertices."""
-        return max(
-            math.sqrt(v.x ** 2 + v.y ** 2 + v.z ** 2)
-            for v in self._original_vertices
-        )
+        # Compare squared lengths; a single sqrt on the winner suffices
+        coords = iter(self._original_coords)
+        return math.sqrt(max(
+            x * x + y * y + z * z for x, y, z in zip(coords, coords, coords)
+        ))
 
 
 # ---------------------------------------------------------------------------
@@ -448,27 +616,100 @@ def _make_face(verts, reverse=False):
     matching Model.get_face_data() convention.
     """
     vs = list(reversed(verts)) if reverse else list(verts)
-    n = len(vs)
-    center = Vec3(
-        sum(v.x for v in vs) / n,
-        sum(v.y for v in vs) / n,
-        sum(v.z for v in vs) / n,
-    )
-    e1 = Vec3(vs[1].x - vs[0].x, vs[1].y - vs[0].y, vs[1].z - vs[0].z)
-    e2 = Vec3(vs[-1].x - vs[0].x, vs[-1].y - vs[0].y, vs[-1].z - vs[0].z)
-    normal = Vec3(
-        e2.y * e1.z - e2.z * e1.y,
-        e2.z * e1.x - e2.x * e1.z,
-        e2.x * e1.y - e2.y * e1.x,
-    ).normalize()
+    center, normal = _face_center_normal(vs)
     return (vs, center, normal)
 
 
+# Wireframe-only face markers (4th face-tuple element).  Terrain edges are
+# fog-faded by the renderer; any other marker keeps its own colour.
+TERRAIN_EDGE = '\033[38;2;60;90;45m.\033[0m'
+PATH_EDGE = '\033[38;2;255;255;0m#\033[0m'      # bright yellow (#FFFF00)
+
+# Optional 5th face-tuple element: indices of the polygon edges to draw
+# (edge i runs from vertex i to vertex i+1).  Terrain quads share edges
+# with their neighbours, so each quad draws only the edges it owns.
+_QUAD_EDGES_INNER = (0, 3)          # v00→v10 and v01→v00
+_QUAD_EDGES_LAST_I = (0, 1, 3)      # + v10→v11 on the far-x row
+_QUAD_EDGES_LAST_J = (0, 2, 3)      # + v11→v01 on the far-z column
+_QUAD_EDGES_ALL = (0, 1, 2, 3)
+
+
+def _make_faces(polys, edge_str=None):
+    """Batch form of _make_face for many polygons at once.
+
+    The centroid / normal math is fused into a single loop over *polys*
+    instead of one helper call per face.  With *edge_str* the tuples get it
+    as a 4th element (wireframe-only faces).
+    """
+    faces = []
+    append = faces.append
+    sqrt = math.sqrt
+    for vs in polys:
+        n = len(vs)
+        a, b, last = vs[0], vs[1], vs[-1]
+        if n == 4:
+            c = vs[2]
+            center = Vec3((a.x + b.x + c.x + last.x) / 4,
+                          (a.y + b.y + c.y + last.y) / 4,
+                          (a.z + b.z + c.z + last.z) / 4)
+        else:
+            center = _face_center(vs)
+        e1x, e1y, e1z = b.x - a.x, b.y - a.y, b.z - a.z
+        e2x, e2y, e2z = last.x - a.x, last.y - a.y, last.z - a.z
+        nx = e2y * e1z - e2z * e1y
+        ny = e2z * e1x - e2x * e1z
+        nz = e2x * e1y - e2y * e1x
+        l2 = nx * nx + ny * ny + nz * nz
+        if l2 > 0:
+            inv = 1.0 / sqrt(l2)
+            normal = Vec3(nx * inv, ny * inv, nz * inv)
+        else:
+            normal = Vec3(0, 0, 0)
+        if edge_str is None:
+            append((vs, center, normal))
+        else:
+            append((vs, center, normal, edge_str))
+    return faces
+
+
 def _rotate_y(lx, lz, cos_a, sin_a):
     """Rotate a point around the Y axis by a pre-computed cos/sin pair."""
     return lx * cos_a + lz * sin_a, -lx * sin_a + lz * cos_a
 
 
+# Forest objects only need a plausible random yaw, so angles are snapped to
+# one of 256 bins and the cos/sin pair is read from a table built at import.
+_ANGLE_BINS = 256                         # power of two — wrap with a mask
+_ANGLE_BIN_SCALE = _ANGLE_BINS / (2.0 * math.pi)
+_ANGLE_COS = tuple(math.cos(2.0 * math.pi * i / _ANGLE_BINS)
+                   for i in range(_ANGLE_BINS))
+_ANGLE_SIN = tuple(math.sin(2.0 * math.pi * i / _ANGLE_BINS)
+                   for i in range(_ANGLE_BINS))
+
+
+# Archetype templates: the pine, oak and bush meshes keep the same face
+# normals at every size (trunks are vertical boxes, canopies scale
+# uniformly), so each archetype's normals are computed once from a canonical
+# unrotated instance and then only Y-rotated per spawned object.
+
+def _template_normals(polys):
+    """Unit normals (as float triples) of a canonical instance's polygons."""
+    normals = []
+    for vs in polys:
+        n = _face_center_normal(vs)[1]
+        normals.append((n.x, n.y, n.z))
+    return tuple(normals)
+
+
+def _instantiate(polys, normals, cos_a, sin_a):
+    """Face tuples for world-space *polys*, reusing Y-rotated template normals."""
+    faces = []
+    for vs, (nx, ny, nz) in zip(polys, normals):
+        rx, rz = _rotate_y(nx, nz, cos_a, sin_a)
+        faces.append((vs, _face_center(vs), Vec3(rx, ny, rz)))
+    return faces
+
+
 def make_pine_tree(wx, wz, height, angle, rng, base_y=0.0):
     """Generate face data for a multi-tier pine tree at world position (wx, base_y, wz).
 
@@ -489,8 +730,15 @@ def make_pine_tree(wx, wz, height, angle, rng, base_y=0.0):
             ||             ← Trunk
             ||
     """
-    faces = []
-    ca, sa = math.cos(angle), math.sin(angle)
+    yaw_bin = int(angle * _ANGLE_BIN_SCALE) & (_ANGLE_BINS - 1)
+    ca, sa = _ANGLE_COS[yaw_bin], _ANGLE_SIN[yaw_bin]
+    return _instantiate(_pine_polys(wx, wz, height, ca, sa, base_y),
+                        _PINE_NORMALS, ca, sa)
+
+
+def _pine_polys(wx, wz, height, ca, sa, base_y):
+    """World-space vertex polygons for make_pine_tree (16 faces)."""
+    polys = []
 
     # Trunk dimensions
     tw = 0.10                   # trunk half-width
@@ -509,7 +757,7 @@ def make_pine_tree(wx, wz, height, angle, rng, base_y=0.0):
         j = (i + 1) % 4
         b0, t0 = trunk_verts[i]
         b1, t1 = trunk_verts[j]
-        faces.append(_make_face([b0, b1, t1, t0]))
+        polys.append([b0, b1, t1, t0])
 
     # 3 stacked canopy tiers — each is a pyramid, progressively smaller
     canopy_start = th * 0.70     # canopy begins below trunk top (overlap)
@@ -537,9 +785,12 @@ def make_pine_tree(wx, wz, height, angle, rng, base_y=0.0):
 
         for i in range(4):
             j = (i + 1) % 4
-            faces.append(_make_face([tier_base[i], tier_base[j], apex]))
+            polys.append([tier_base[i], tier_base[j], apex])
 
-    return faces
+    return polys
+
+
+_PINE_NORMALS = _template_normals(_pine_polys(0.0, 0.0, 1.0, 1.0, 0.0, 0.0))
 
 
 def make_rock(wx, wz, scale, angle, rng, base_y=0.0):
@@ -547,8 +798,8 @@ def make_rock(wx, wz, scale, angle, rng, base_y=0.0):
 
     Geometry: irregular tetrahedron = 4 triangular faces.
     """
-    faces = []
-    ca, sa = math.cos(angle), math.sin(angle)
+    yaw_bin = int(angle * _ANGLE_BIN_SCALE) & (_ANGLE_BINS - 1)
+    ca, sa = _ANGLE_COS[yaw_bin], _ANGLE_SIN[yaw_bin]
 
     rh = scale * (0.3 + rng.random() * 0.3)
     rw = scale * 0.5
@@ -569,11 +820,12 @@ def make_rock(wx, wz, scale, angle, rng, base_y=0.0):
         rx, rz = _rotate_y(lx, lz, ca, sa)
         pts.append(Vec3(wx + rx, ly, wz + rz))
 
-    faces.append(_make_face([pts[0], pts[1], pts[3]]))
-    faces.append(_make_face([pts[1], pts[2], pts[3]]))
-    faces.append(_make_face([pts[2], pts[0], pts[3]]))
-    faces.append(_make_face([pts[0], pts[2], pts[1]]))   # bottom
-    return faces
+    return _make_faces([
+        [pts[0], pts[1], pts[3]],
+        [pts[1], pts[2], pts[3]],
+        [pts[2], pts[0], pts[3]],
+        [pts[0], pts[2], pts[1]],           # bottom
+    ])
 
 
 def make_bush(wx, wz, scale, angle, rng, base_y=0.0):
@@ -581,9 +833,14 @@ def make_bush(wx, wz, scale, angle, rng, base_y=0.0):
 
     Geometry: low pyramid = 4 triangular faces.
     """
-    faces = []
-    ca, sa = math.cos(angle), math.sin(angle)
+    yaw_bin = int(angle * _ANGLE_BIN_SCALE) & (_ANGLE_BINS - 1)
+    ca, sa = _ANGLE_COS[yaw_bin], _ANGLE_SIN[yaw_bin]
+    return _instantiate(_bush_polys(wx, wz, scale, ca, sa, base_y),
+                        _BUSH_NORMALS, ca, sa)
+
 
+def _bush_polys(wx, wz, scale, ca, sa, base_y):
+    """World-space vertex polygons for make_bush (4 faces)."""
     bw = scale * 0.4           # base half-width
     bh = scale * 0.35          # height
     apex = Vec3(wx, base_y + bh, wz)
@@ -593,11 +850,10 @@ def make_bush(wx, wz, scale, angle, rng, base_y=0.0):
         rx, rz = _rotate_y(lx, lz, ca, sa)
         base.append(Vec3(wx + rx, base_y, wz + rz))
 
-    for i in range(4):
-        j = (i + 1) % 4
-        faces.append(_make_face([base[i], base[j], apex]))
+    return [[base[i], base[(i + 1) % 4], apex] for i in range(4)]
 
-    return faces
+
+_BUSH_NORMALS = _template_normals(_bush_polys(0.0, 0.0, 1.0, 1.0, 0.0, 0.0))
 
 
 def make_oak_tree(wx, wz, height, angle, rng, base_y=0.0):
@@ -616,8 +872,15 @@ def make_oak_tree(wx, wz, height, angle, rng, base_y=0.0):
                ||||           ← Trunk
                ||
     """
-    faces = []
-    ca, sa = math.cos(angle), math.sin(angle)
+    yaw_bin = int(angle * _ANGLE_BIN_SCALE) & (_ANGLE_BINS - 1)
+    ca, sa = _ANGLE_COS[yaw_bin], _ANGLE_SIN[yaw_bin]
+    return _instantiate(_oak_polys(wx, wz, height, ca, sa, base_y),
+                        _OAK_NORMALS, ca, sa)
+
+
+def _oak_polys(wx, wz, height, ca, sa, base_y):
+    """World-space vertex polygons for make_oak_tree (12 faces)."""
+    polys = []
 
     # Trunk dimensions — thicker than pine
     tw = 0.15                   # trunk half-width (0.15 vs 0.10 for pine)
@@ -636,7 +899,7 @@ def make_oak_tree(wx, wz, height, angle, rng, base_y=0.0):
         j = (i + 1) % 4
         b0, t0 = trunk_verts[i]
         b1, t1 = trunk_verts[j]
-        faces.append(_make_face([b0, b1, t1, t0]))
+        polys.append([b0, b1, t1, t0])
 
     # Canopy — large rounded sphere approximation (icosphere-like, 8 faces)
     canopy_center_y = base_y + th + height * 0.35
@@ -658,15 +921,18 @@ def make_oak_tree(wx, wz, height, angle, rng, base_y=0.0):
     # 4 triangular faces from base to apex
     for i in range(4):
         j = (i + 1) % 4
-        faces.append(_make_face([top_verts[i], top_verts[j], apex]))
+        polys.append([top_verts[i], top_verts[j], apex])
 
     # 4 triangular faces forming the bottom of the canopy
     bottom_apex = Vec3(wx, canopy_center_y - canopy_radius * 0.5, wz)
     for i in range(4):
         j = (i + 1) % 4
-        faces.append(_make_face([top_verts[j], top_verts[i], bottom_apex]))
+        polys.append([top_verts[j], top_verts[i], bottom_apex])
 
-    return faces
+    return polys
+
+
+_OAK_NORMALS = _template_normals(_oak_polys(0.0, 0.0, 1.0, 1.0, 0.0, 0.0))
 
 
 def make_ground_quad(cx, cz, chunk_size):
@@ -685,26 +951,62 @@ def make_ground_quad(cx, cz, chunk_size):
     v2 = Vec3(x1, y, z1)
     v3 = Vec3(x0, y, z1)
 
-    return [
-        _make_face([v0, v1, v2, v3]),       # top    (normal +y)
-        _make_face([v3, v2, v1, v0]),       # bottom (normal −y)
-    ]
+    return _make_faces([
+        [v0, v1, v2, v3],                   # top    (normal +y)
+        [v3, v2, v1, v0],                   # bottom (normal −y)
+    ])
 
 
 # ---------------------------------------------------------------------------
 # Terrain height — procedural noise for hills and valleys
 # ---------------------------------------------------------------------------
 
+# Guaranteed landmark mountain near spawn — a steep gaussian peak behind the
+# camera start position (cam starts at 6,_,6 facing −Z).  Shared by
+# terrain_height() and chunk_has_mountain() so the two always agree.
+LANDMARK_MTN_X, LANDMARK_MTN_Z = 6.0, 45.0    # 39 units behind spawn
+LANDMARK_MTN_RADIUS = 18.0                    # steep-ish slope
+LANDMARK_MTN_PEAK = 30.0                      # very tall
+_LANDMARK_CUTOFF_SQ = (LANDMARK_MTN_RADIUS * 3.0) ** 2   # skip beyond 3× radius
+_LANDMARK_TWO_R_SQ = 2.0 * LANDMARK_MTN_RADIUS * LANDMARK_MTN_RADIUS
+
+
+def _octaves(scale, amplitude):
+    """(lattice scale, amplitude) for the two rolling-hill octaves."""
+    return ((scale, amplitude), (scale * 0.4, amplitude * 0.25))
+
+
+# Noise parameters for the default terrain.  Samples divide by the lattice
+# scale rather than multiply by a reciprocal: 1/3.2 and 1/70 are inexact,
+# and webgl-port/js/terrain.js divides too, so both ports agree bit-for-bit.
+_OCTAVES = _octaves(8.0, 2.5)
+_MTN_SCALE = 70.0               # mountain layer lattice scale
+_MTN_AMP = 25.0
+
+
+# Only the low 16 bits of the 32-bit LCG/xor hash reach the output, and
+# carries in + and * only propagate upward, so the whole hash can run
+# modulo 2**16 with the multipliers pre-reduced.  Keeps every product
+# inside a machine-word-sized int instead of growing Python bignums.
+_HASH_MUL = 1103515245 & 0xFFFF
+_HASH_X = 73856093 & 0xFFFF
+_HASH_Z = 19349663 & 0xFFFF
+
+
+@functools.lru_cache(maxsize=65536)
 def _terrain_hash(ix, iz, seed):
-    """Hash grid coordinates to a pseudo-random height in [0, 1]."""
-    h = (seed * 1103515245 + 12345) & 0xFFFFFFFF
-    h = (h ^ ((ix * 73856093) & 0xFFFFFFFF)) & 0xFFFFFFFF
-    h = ((h * 1103515245 + 12345)
-         ^ ((iz * 19349663) & 0xFFFFFFFF)) & 0xFFFFFFFF
-    return (h & 0xFFFF) / 0xFFFF
+    """Hash grid coordinates to a pseudo-random height in [0, 1].
+
+    Memoised: neighbouring terrain samples and adjacent chunks hit the same
+    lattice corners over and over.
+    """
+    h = ((seed * _HASH_MUL + 12345) ^ (ix * _HASH_X)) & 0xFFFF
+    h = ((h * _HASH_MUL + 12345) ^ (iz * _HASH_Z)) & 0xFFFF
+    return h / 0xFFFF
 
 
-def terrain_height(wx, wz, seed, scale=8.0, amplitude=2.5):
+def terrain_height(wx, wz, seed, scale=8.0, amplitude=2.5,
+                   _floor=math.floor, _exp=math.exp, _hash=_terrain_hash):
     """Return terrain height at world position (wx, wz).
 
     Uses two octaves of smoothed value noise for rolling hills, plus a
@@ -715,105 +1017,192 @@ def terrain_height(wx, wz, seed, scale=8.0, amplitude=2.5):
     (behind the camera start) so there is always a dramatic peak
     visible for reference.
     """
-    total = 0.0
-    for octave_scale, octave_amp in ((scale, amplitude),
-                                     (scale * 0.4, amplitude * 0.25)):
-        gx = wx / octave_scale
-        gz = wz / octave_scale
-        ix = int(math.floor(gx))
-        iz = int(math.floor(gz))
-        fx = gx - ix
-        fz = gz - iz
-        # Smoothstep interpolation
-        fx = fx * fx * (3.0 - 2.0 * fx)
-        fz = fz * fz * (3.0 - 2.0 * fz)
-        # Bilinear interpolation of hashed corner values
-        h00 = _terrain_hash(ix, iz, seed)
-        h10 = _terrain_hash(ix + 1, iz, seed)
-        h01 = _terrain_hash(ix, iz + 1, seed)
-        h11 = _terrain_hash(ix + 1, iz + 1, seed)
-        h0 = h00 + (h10 - h00) * fx
-        h1 = h01 + (h11 - h01) * fx
-        total += (h0 + (h1 - h0) * fz) * octave_amp
+    if scale == 8.0 and amplitude == 2.5:
+        (s1, amp1), (s2, amp2) = _OCTAVES
+    else:
+        (s1, amp1), (s2, amp2) = _octaves(scale, amplitude)
+
+    # Octave 1 — rolling hills
+    gx = wx / s1
+    gz = wz / s1
+    ix = int(_floor(gx))
+    iz = int(_floor(gz))
+    fx = gx - ix
+    fz = gz - iz
+    # Smoothstep interpolation
+    fx = fx * fx * (3.0 - 2.0 * fx)
+    fz = fz * fz * (3.0 - 2.0 * fz)
+    # Bilinear interpolation of hashed corner values
+    h00 = _hash(ix, iz, seed)
+    h10 = _hash(ix + 1, iz, seed)
+    h01 = _hash(ix, iz + 1, seed)
+    h11 = _hash(ix + 1, iz + 1, seed)
+    h0 = h00 + (h10 - h00) * fx
+    h1 = h01 + (h11 - h01) * fx
+    total = (h0 + (h1 - h0) * fz) * amp1
+
+    # Octave 2 — finer detail
+    gx = wx / s2
+    gz = wz / s2
+    ix = int(_floor(gx))
+    iz = int(_floor(gz))
+    fx = gx - ix
+    fz = gz - iz
+    fx = fx * fx * (3.0 - 2.0 * fx)
+    fz = fz * fz * (3.0 - 2.0 * fz)
+    h00 = _hash(ix, iz, seed)
+    h10 = _hash(ix + 1, iz, seed)
+    h01 = _hash(ix, iz + 1, seed)
+    h11 = _hash(ix + 1, iz + 1, seed)
+    h0 = h00 + (h10 - h00) * fx
+    h1 = h01 + (h11 - h01) * fx
+    total += (h0 + (h1 - h0) * fz) * amp2
 
     # Mountain layer — rare, very large peaks
-    mtn_scale = 70.0
-    mtn_amp = 25.0
     mtn_seed = seed ^ 0xDEADBEEF
-    gx = wx / mtn_scale
-    gz = wz / mtn_scale
-    ix = int(math.floor(gx))
-    iz = int(math.floor(gz))
+    gx = wx / _MTN_SCALE
+    gz = wz / _MTN_SCALE
+    ix = int(_floor(gx))
+    iz = int(_floor(gz))
     fx = gx - ix
     fz = gz - iz
     fx = fx * fx * (3.0 - 2.0 * fx)
     fz = fz * fz * (3.0 - 2.0 * fz)
-    h00 = _terrain_hash(ix, iz, mtn_seed)
-    h10 = _terrain_hash(ix + 1, iz, mtn_seed)
-    h01 = _terrain_hash(ix, iz + 1, mtn_seed)
-    h11 = _terrain_hash(ix + 1, iz + 1, mtn_seed)
+    h00 = _hash(ix, iz, mtn_seed)
+    h10 = _hash(ix + 1, iz, mtn_seed)
+    h01 = _hash(ix, iz + 1, mtn_seed)
+    h11 = _hash(ix + 1, iz + 1, mtn_seed)
     h0 = h00 + (h10 - h00) * fx
     h1 = h01 + (h11 - h01) * fx
     mtn_noise = h0 + (h1 - h0) * fz
     # Threshold + cubic curve → only the highest noise peaks form mountains
     mtn_factor = max(0.0, (mtn_noise - 0.65) / 0.35)
-    total += mtn_factor * mtn_factor * mtn_factor * mtn_amp
+    total += mtn_factor * mtn_factor * mtn_factor * _MTN_AMP
 
-    # Guaranteed landmark mountain near spawn — a steep gaussian peak
-    # behind the camera start position (cam starts at 6,_,6 facing −Z).
+    # Guaranteed landmark mountain near spawn.
     # Turn around (face +Z) to see it rising above the forest.
-    mtn_cx, mtn_cz = 6.0, 45.0         # 39 units behind spawn
-    mtn_radius = 18.0                   # steep-ish slope
-    mtn_peak = 30.0                     # very tall
-    dmx = wx - mtn_cx
-    dmz = wz - mtn_cz
+    dmx = wx - LANDMARK_MTN_X
+    dmz = wz - LANDMARK_MTN_Z
     d2 = dmx * dmx + dmz * dmz
-    cutoff = mtn_radius * 3.0           # skip math beyond 3× radius
-    if d2 < cutoff * cutoff:
-        total += mtn_peak * math.exp(-d2 / (2.0 * mtn_radius * mtn_radius))
+    if d2 < _LANDMARK_CUTOFF_SQ:
+        total += LANDMARK_MTN_PEAK * _exp(-d2 / _LANDMARK_TWO_R_SQ)
 
     return total - amplitude * 0.3    # centre around slightly below zero
 
 
+def _noise_axis(coords, noise_scale, _floor=math.floor):
+    """Lattice index and smoothstep weight for each coordinate on one axis."""
+    out = []
+    for w in coords:
+        g = w / noise_scale
+        i = int(_floor(g))
+        f = g - i
+        out.append((i, f * f * (3.0 - 2.0 * f)))
+    return out
+
+
+def terrain_height_grid(xs, zs, seed, scale=8.0, amplitude=2.5):
+    """Batched terrain_height() over the lattice *xs* × *zs*.
+
+    Returns ``heights[i][j] == terrain_height(xs[i], zs[j], seed)`` exactly.
+    Value noise is separable, so the floor / smoothstep work is done once
+    per row and column instead of once per sample; only the corner lookups
+    and blends remain per point.
+    """
+    mtn_seed = seed ^ 0xDEADBEEF
+    if scale == 8.0 and amplitude == 2.5:
+        octaves = _OCTAVES
+    else:
+        octaves = _octaves(scale, amplitude)
+    layers = tuple((_noise_axis(xs, sc), _noise_axis(zs, sc), amp)
+                   for sc, amp in octaves)
+    mtn_x = _noise_axis(xs, _MTN_SCALE)
+    mtn_z = _noise_axis(zs, _MTN_SCALE)
+    bias = amplitude * 0.3
+    th = _terrain_hash
+    exp = math.exp
+
+    heights = []
+    for a, wx in enumerate(xs):
+        row = []
+        dmx = wx - LANDMARK_MTN_X
+        for b, wz in enumerate(zs):
+            total = 0.0
+            for ax, az, octave_amp in layers:
+                ix, fx = ax[a]
+                iz, fz = az[b]
+                h00 = th(ix, iz, seed)
+                h10 = th(ix + 1, iz, seed)
+                h01 = th(ix, iz + 1, seed)
+                h11 = th(ix + 1, iz + 1, seed)
+                h0 = h00 + (h10 - h00) * fx
+                h1 = h01 + (h11 - h01) * fx
+                total += (h0 + (h1 - h0) * fz) * octave_amp
+
+            ix, fx = mtn_x[a]
+            iz, fz = mtn_z[b]
+            h00 = th(ix, iz, mtn_seed)
+            h10 = th(ix + 1, iz, mtn_seed)
+            h01 = th(ix, iz + 1, mtn_seed)
+            h11 = th(ix + 1, iz + 1, mtn_seed)
+            h0 = h00 + (h10 - h00) * fx
+            h1 = h01 + (h11 - h01) * fx
+            mtn_factor = max(0.0, (h0 + (h1 - h0) * fz - 0.65) / 0.35)
+            total += mtn_factor * mtn_factor * mtn_factor * _MTN_AMP
+
+            dmz = wz - LANDMARK_MTN_Z
+            d2 = dmx * dmx + dmz * dmz
+            if d2 < _LANDMARK_CUTOFF_SQ:
+                total += LANDMARK_MTN_PEAK * exp(-d2 / _LANDMARK_TWO_R_SQ)
+            row.append(total - bias)
+        heights.append(row)
+    return heights
+
+
 def make_terrain_grid(cx, cz, chunk_size, seed, grid_res=6):
     """Generate wireframe terrain quads for chunk (cx, cz).
 
-    Returns a list of (verts, center, normal, edge_str) tuples.
-    The 4th element marks them as wireframe-only faces for the renderer.
+    Returns a list of (verts, center, normal, edge_str, edges) tuples.
+    The 4th element marks them as wireframe-only faces for the renderer;
+    the 5th lists the quad edges not shared with an earlier quad, so each
+    of the 2*grid_res*(grid_res+1) grid edges is drawn once.
     """
-    TERRAIN_EDGE = '\033[38;2;60;90;45m.\033[0m'
-
-    faces = []
+    polys = []
     cs = chunk_size
     cell = cs / grid_res
     x0 = cx * cs
     z0 = cz * cs
 
-    # Build vertex grid (grid_res+1 × grid_res+1)
-    grid = []
-    for gi in range(grid_res + 1):
-        row = []
-        for gj in range(grid_res + 1):
-            vx = x0 + gi * cell
-            vz = z0 + gj * cell
-            vy = terrain_height(vx, vz, seed)
-            row.append(Vec3(vx, vy, vz))
-        grid.append(row)
-
-    # Generate quads
+    # Build vertex grid (grid_res+1 × grid_res+1) from one batched query
+    xs = [x0 + gi * cell for gi in range(grid_res + 1)]
+    zs = [z0 + gj * cell for gj in range(grid_res + 1)]
+    heights = terrain_height_grid(xs, zs, seed)
+    grid = [[Vec3(vx, vy, vz) for vz, vy in zip(zs, hrow)]
+            for vx, hrow in zip(xs, heights)]
+
+    # Generate quads, each owning its v00 edges plus the far grid border
+    owned = []
+    last = grid_res - 1
     for gi in range(grid_res):
         for gj in range(grid_res):
             v00 = grid[gi][gj]
             v10 = grid[gi + 1][gj]
             v11 = grid[gi + 1][gj + 1]
             v01 = grid[gi][gj + 1]
-            face = _make_face([v00, v10, v11, v01])
-            faces.append((face[0], face[1], face[2], TERRAIN_EDGE))
+            polys.append([v00, v10, v11, v01])
+            if gi == last:
+                owned.append(_QUAD_EDGES_ALL if gj == last
+                             else _QUAD_EDGES_LAST_I)
+            else:
+                owned.append(_QUAD_EDGES_LAST_J if gj == last
+                             else _QUAD_EDGES_INNER)
 
-    return faces
+    return [face + (edges,)
+            for face, edges in zip(_make_faces(polys, TERRAIN_EDGE), owned)]
 
 
-def chunk_has_mountain(cx, cz, chunk_size, seed, threshold=0.70):
+def chunk_has_mountain(cx, cz, chunk_size, seed, threshold=0.70,
+                       _floor=math.floor, _hash=_terrain_hash):
     """Check whether the chunk at (cx, cz) contains significant mountain terrain.
 
     Evaluates the mountain noise at the chunk centre — the same low-frequency
@@ -827,34 +1216,70 @@ def chunk_has_mountain(cx, cz, chunk_size, seed, threshold=0.70):
     wx = cx * chunk_size + chunk_size * 0.5
     wz = cz * chunk_size + chunk_size * 0.5
 
-    # Guaranteed landmark mountain near spawn (must match terrain_height())
-    mtn_cx, mtn_cz = 6.0, 45.0
-    mtn_radius = 18.0
-    dmx = wx - mtn_cx
-    dmz = wz - mtn_cz
-    if dmx * dmx + dmz * dmz < (mtn_radius * 3.0) ** 2:
+    # Guaranteed landmark mountain near spawn
+    dmx = wx - LANDMARK_MTN_X
+    dmz = wz - LANDMARK_MTN_Z
+    if dmx * dmx + dmz * dmz < _LANDMARK_CUTOFF_SQ:
         return True
 
     mtn_seed = seed ^ 0xDEADBEEF
-    mtn_scale = 70.0
-    gx = wx / mtn_scale
-    gz = wz / mtn_scale
-    ix = int(math.floor(gx))
-    iz = int(math.floor(gz))
+    gx = wx / _MTN_SCALE
+    gz = wz / _MTN_SCALE
+    ix = int(_floor(gx))
+    iz = int(_floor(gz))
     fx = gx - ix
     fz = gz - iz
     fx = fx * fx * (3.0 - 2.0 * fx)
     fz = fz * fz * (3.0 - 2.0 * fz)
-    h00 = _terrain_hash(ix, iz, mtn_seed)
-    h10 = _terrain_hash(ix + 1, iz, mtn_seed)
-    h01 = _terrain_hash(ix, iz + 1, mtn_seed)
-    h11 = _terrain_hash(ix + 1, iz + 1, mtn_seed)
+    h00 = _hash(ix, iz, mtn_seed)
+    h10 = _hash(ix + 1, iz, mtn_seed)
+    h01 = _hash(ix, iz + 1, mtn_seed)
+    h11 = _hash(ix + 1, iz + 1, mtn_seed)
     h0 = h00 + (h10 - h00) * fx
     h1 = h01 + (h11 - h01) * fx
     mtn_noise = h0 + (h1 - h0) * fz
     return mtn_noise > threshold
 
 
+def chunk_has_mountain_batch(keys, chunk_size, seed, threshold=0.70):
+    """chunk_has_mountain() for many (cx, cz) keys; returns a list of bools.
+
+    The mountain lattice is ~6 chunks wide, so a scan window touches few
+    distinct lattice rows and columns: the per-axis floor / smoothstep work
+    is done once per chunk column and row, and corner hashes come from the
+    memoised _terrain_hash, instead of redoing both for every chunk.
+    """
+    if not keys:
+        return []
+    half = chunk_size * 0.5
+    cxs = sorted({k[0] for k in keys})
+    czs = sorted({k[1] for k in keys})
+    wxs = [cx * chunk_size + half for cx in cxs]
+    wzs = [cz * chunk_size + half for cz in czs]
+    col = dict(zip(cxs, zip(wxs, _noise_axis(wxs, _MTN_SCALE))))
+    row = dict(zip(czs, zip(wzs, _noise_axis(wzs, _MTN_SCALE))))
+    mtn_seed = seed ^ 0xDEADBEEF
+    th = _terrain_hash
+
+    out = []
+    for cx, cz in keys:
+        wx, (ix, fx) = col[cx]
+        wz, (iz, fz) = row[cz]
+        dmx = wx - LANDMARK_MTN_X
+        dmz = wz - LANDMARK_MTN_Z
+        if dmx * dmx + dmz * dmz < _LANDMARK_CUTOFF_SQ:
+            out.append(True)
+            continue
+        h00 = th(ix, iz, mtn_seed)
+        h10 = th(ix + 1, iz, mtn_seed)
+        h01 = th(ix, iz + 1, mtn_seed)
+        h11 = th(ix + 1, iz + 1, mtn_seed)
+        h0 = h00 + (h10 - h00) * fx
+        h1 = h01 + (h11 - h01) * fx
+        out.append(h0 + (h1 - h0) * fz > threshold)
+    return out
+
+
 # ---------------------------------------------------------------------------
 # ForestChunk — a single chunk of procedurally generated forest
 # ---------------------------------------------------------------------------
@@ -877,6 +1302,10 @@ class ForestChunk:
         ('bush',  0.25),
         ('empty', 0.25),
     ]
+    # Cumulative thresholds for a bisect lookup; a roll past the last
+    # threshold (float rounding) falls through to the trailing 'empty'.
+    _OBJ_CUM = tuple(itertools.accumulate(w for _, w in OBJ_WEIGHTS))
+    _OBJ_NAMES = tuple(name for name, _ in OBJ_WEIGHTS) + ('empty',)
 
     def __init__(self, cx: int, cz: int, chunk_size: float,
                  world_seed: int, terrain_only: bool = False):
@@ -884,8 +1313,14 @@ class ForestChunk:
         self.cz = cz
         self.chunk_size = chunk_size
         self.terrain_only = terrain_only
+        # World-space chunk centre, used by ForestWorld's per-frame culling
+        self.center_x = cx * chunk_size + chunk_size * 0.5
+        self.center_z = cz * chunk_size + chunk_size * 0.5
         self.face_data: list = []
         self._generate(world_seed)
+        # Chunk geometry is immutable once built: a tuple is packed exactly
+        # (no list growth slack) and is shared read-only with the renderer.
+        self.face_data = tuple(self.face_data)
 
     # -- seeded generation ---------------------------------------------------
 
@@ -901,6 +1336,7 @@ class ForestChunk:
     def _generate(self, world_seed: int):
         rng = random.Random(
             self._chunk_seed(world_seed, self.cx, self.cz))
+        rand = rng.random
         cs = self.chunk_size
         cell_size = cs / self.CELL_GRID
 
@@ -914,6 +1350,8 @@ class ForestChunk:
             return
 
         # Place objects in each cell
+        bisect_right = bisect.bisect_right
+        obj_cum, obj_names = self._OBJ_CUM, self._OBJ_NAMES
         for gi in range(self.CELL_GRID):
             for gj in range(self.CELL_GRID):
                 # Cell centre in world space
@@ -921,42 +1359,35 @@ class ForestChunk:
                 cell_cz = self.cz * cs + (gj + 0.5) * cell_size
 
                 # Weighted random object type
-                roll = rng.random()
-                cumulative = 0.0
-                obj_type = 'empty'
-                for otype, weight in self.OBJ_WEIGHTS:
-                    cumulative += weight
-                    if roll < cumulative:
-                        obj_type = otype
-                        break
+                obj_type = obj_names[bisect_right(obj_cum, rand())]
 
                 if obj_type == 'empty':
                     continue
 
                 # Jitter position within cell
-                jx = (rng.random() - 0.5) * cell_size * 0.7
-                jz = (rng.random() - 0.5) * cell_size * 0.7
+                jx = (rand() - 0.5) * cell_size * 0.7
+                jz = (rand() - 0.5) * cell_size * 0.7
                 wx = cell_cx + jx
                 wz = cell_cz + jz
 
                 # Random rotation
-                angle = rng.random() * math.pi * 2
+                angle = rand() * math.pi * 2
 
                 # Terrain height at object position
                 by = terrain_height(wx, wz, world_seed)
 
                 if obj_type == 'tree':
-                    height = 1.8 + rng.random() * 1.5   # 1.8–3.3
+                    height = 1.8 + rand() * 1.5   # 1.8–3.3
                     self.face_data.extend(
                         make_pine_tree(wx, wz, height, angle, rng,
                                        base_y=by))
                 elif obj_type == 'rock':
-                    scale = 0.25 + rng.random() * 0.4   # 0.25–0.65
+                    scale = 0.25 + rand() * 0.4   # 0.25–0.65
                     self.face_data.extend(
                         make_rock(wx, wz, scale, angle, rng,
                                   base_y=by))
                 elif obj_type == 'bush':
-                    scale = 0.4 + rng.random() * 0.3    # 0.4–0.7
+                    scale = 0.4 + rand() * 0.3    # 0.4–0.7
                     self.face_data.extend(
                         make_bush(wx, wz, scale, angle, rng,
                                   base_y=by))
@@ -977,6 +1408,11 @@ class ForestWorld:
     be passed in place of a ``Model``.
     """
 
+    # Recently unloaded chunks kept for reuse.  Generation is deterministic
+    # in (cx, cz, terrain_only), so walking back over old ground can take
+    # the chunk from here instead of rebuilding it.
+    CHUNK_CACHE_SIZE = 512
+
     def __init__(self, seed: int = 42, chunk_size: float = 12.0,
                  render_distance: int = 2):
         self.seed = seed
@@ -988,10 +1424,16 @@ class ForestWorld:
         self._last_face_count = 0       # for status-bar diagnostics
         self._last_mtn_chunks = 0       # mountain chunks loaded (diagnostics)
         self._mtn_cache: dict = {}      # (cx, cz) → bool — mountain noise cache
+        self._tier_key = None           # (cam_cx, cam_cz, rd) of cached tiers
+        self._tiers = None              # (needed, terrain, mountain, all) sets
+        self._tiers_loaded = False      # every chunk of _tiers is in chunks
+        # (cx, cz, terrain_only) → evicted ForestChunk, oldest first
+        self._chunk_cache = collections.OrderedDict()
         
         # Special tree (golden oak) — spawns at random location ~10 sec walk from spawn
         self.special_tree_pos = None    # (wx, wz, base_y) or None
         self.special_tree_face_data = None  # pre-computed face data
+        self._path_face_data = ()       # yellow spawn → tree path markers
         self.spawn_pos = Vec3(6.0, 0.0, 6.0)  # player spawn position
         self._special_tree_spawned = False
 
@@ -1029,34 +1471,55 @@ class ForestWorld:
         self.special_tree_face_data = make_oak_tree(wx, wz, height, tree_angle, rng, base_y)
         
         self._special_tree_spawned = True
+        self._path_face_data = self._build_path_faces()
 
-    def update(self, camera: 'Camera'):
-        """Load / unload chunks based on camera position.
+    def _build_path_faces(self) -> tuple:
+        """Wireframe diamond markers along the path from spawn to the tree.
 
-        Three loading tiers:
-          1. Full detail (objects + terrain) within render_distance
-          2. Intermediate terrain-only within terrain_rd — fills the visual
-             gap between nearby geometry and distant mountains so the ground
-             connects seamlessly and mountains don't appear to float.
-          3. Mountain-only terrain beyond terrain_rd where chunk_has_mountain()
-             is true — renders distant peak silhouettes.
+        Terrain is deterministic and the tree never moves, so this runs
+        once when the tree spawns rather than on every frame.
+        """
+        wx, wz, base_y = self.special_tree_pos
+        spawn_x, spawn_z = self.spawn_pos.x, self.spawn_pos.z
+
+        # Generate path as a series of small markers along the path
+        path_dx = wx - spawn_x
+        path_dz = wz - spawn_z
+        path_length = math.sqrt(path_dx**2 + path_dz**2)
+        num_markers = int(path_length / 1.5)  # One marker every 1.5 units for denser path
+        steps = max(num_markers, 1)
+        seed = self.seed
+        marker_size = 0.6   # diamond half-width - larger for visibility
+
+        polys = []
+        for i in range(num_markers + 1):
+            t = i / steps
+            px = spawn_x + t * path_dx
+            pz = spawn_z + t * path_dz
+            py = terrain_height(px, pz, seed) + 0.01
+
+            # Diamond shape marker on ground
+            polys.append([
+                Vec3(px, py, pz - marker_size),
+                Vec3(px + marker_size, py, pz),
+                Vec3(px, py, pz + marker_size),
+                Vec3(px - marker_size, py, pz),
+            ])
+
+        # Yellow wireframe-only quads (PATH_EDGE as the 4th element)
+        return tuple(_make_faces(polys, PATH_EDGE))
+
+    def _compute_tiers(self, cam_cx: int, cam_cz: int, rd: int) -> tuple:
+        """Chunk key sets for the three loading tiers around a camera chunk.
+
+        Returns ``(needed, terrain_needed, mtn_needed, all_needed)``.
         """
-        # Spawn special tree on first update
-        self._spawn_special_tree()
-        
-        self._cam_pos = camera.position
-        self._cam_forward = camera.forward
-
         cs = self.chunk_size
-        cam_cx = int(math.floor(camera.position.x / cs))
-        cam_cz = int(math.floor(camera.position.z / cs))
-        rd = self.render_distance
 
         # ── Tier 1: normal chunks (full detail) ──────────────────────────
-        needed = set()
-        for dx in range(-rd, rd + 1):
-            for dz in range(-rd, rd + 1):
-                needed.add((cam_cx + dx, cam_cz + dz))
+        needed = {(cam_cx + dx, cam_cz + dz)
+                  for dx in range(-rd, rd + 1)
+                  for dz in range(-rd, rd + 1)}
 
         # Mountain scan radius (used by tiers 2 and 3)
         mtn_rd = max(16, rd * 3)
@@ -1067,61 +1530,102 @@ class ForestWorld:
         # keep chunk count manageable (scales up on mountaintops where
         # dynamic rd increases).
         terrain_rd = max(8, rd * 3)
-        terrain_needed = set()
-        for dx in range(-terrain_rd, terrain_rd + 1):
-            for dz in range(-terrain_rd, terrain_rd + 1):
-                key = (cam_cx + dx, cam_cz + dz)
-                if key not in needed:
-                    terrain_needed.add(key)
+        terrain_needed = {(cam_cx + dx, cam_cz + dz)
+                          for dx in range(-terrain_rd, terrain_rd + 1)
+                          for dz in range(-terrain_rd, terrain_rd + 1)}
+        terrain_needed -= needed
 
         # ── Tier 3: extended mountain chunks (terrain wireframe only) ────
         # Scan a much wider radius; only load chunks that contain mountain
         # noise so their silhouettes are visible from far away.
         mtn_needed = set()
         mtn_cache = self._mtn_cache
+        candidates = []
         for dx in range(-mtn_rd, mtn_rd + 1):
             for dz in range(-mtn_rd, mtn_rd + 1):
                 key = (cam_cx + dx, cam_cz + dz)
                 if key in needed or key in terrain_needed:
                     continue        # already covered by tier 1 or 2
-                if key not in mtn_cache:
-                    mtn_cache[key] = chunk_has_mountain(
-                        key[0], key[1], cs, self.seed)
-                if mtn_cache[key]:
-                    mtn_needed.add(key)
-        self._last_mtn_chunks = len(mtn_needed)
-
+                candidates.append(key)
+        # Evaluate every not-yet-seen chunk in one batched lattice pass
+        unseen = [key for key in candidates if key not in mtn_cache]
+        mtn_cache.update(zip(unseen, chunk_has_mountain_batch(
+            unseen, cs, self.seed)))
+        for key in candidates:
+            if mtn_cache[key]:
+                mtn_needed.add(key)
         all_needed = needed | terrain_needed | mtn_needed
+        return needed, terrain_needed, mtn_needed, all_needed
+
+    def update(self, camera: 'Camera'):
+        """Load / unload chunks based on camera position.
+
+        Three loading tiers:
+          1. Full detail (objects + terrain) within render_distance
+          2. Intermediate terrain-only within terrain_rd — fills the visual
+             gap between nearby geometry and distant mountains so the ground
+             connects seamlessly and mountains don't appear to float.
+          3. Mountain-only terrain beyond terrain_rd where chunk_has_mountain()
+             is true — renders distant peak silhouettes.
+        """
+        # Spawn special tree on first update
+        self._spawn_special_tree()
+        
+        self._cam_pos = camera.position
+        self._cam_forward = camera.forward
 
-        # Unload chunks that are no longer in any tier
-        to_remove = [k for k in self.chunks if k not in all_needed]
-        for k in to_remove:
-            del self.chunks[k]
+        cs = self.chunk_size
+        cam_cx = int(math.floor(camera.position.x / cs))
+        cam_cz = int(math.floor(camera.position.z / cs))
+        rd = self.render_distance
+
+        # The tier sets depend only on the camera's chunk and the render
+        # distance, so they are rebuilt only when one of those changes.
+        tier_key = (cam_cx, cam_cz, rd)
+        if tier_key != self._tier_key:
+            self._tiers = self._compute_tiers(cam_cx, cam_cz, rd)
+            self._tier_key = tier_key
+            self._tiers_loaded = False
+            all_needed = self._tiers[3]
+
+            # Unload chunks that are no longer in any tier (into the LRU).
+            # Chunks are only ever loaded from the tiers, so this can only
+            # find anything right after the tiers change.
+            to_remove = [k for k in self.chunks if k not in all_needed]
+            cache = self._chunk_cache
+            for k in to_remove:
+                chunk = self.chunks.pop(k)
+                cache[(k[0], k[1], chunk.terrain_only)] = chunk
+            while len(cache) > self.CHUNK_CACHE_SIZE:
+                cache.popitem(last=False)
+        elif self._tiers_loaded:
+            return
+        needed, terrain_needed, mtn_needed, all_needed = self._tiers
+        self._last_mtn_chunks = len(mtn_needed)
 
         # Load new chunks (limit per frame to avoid stutter; higher when
         # render distance is large, e.g. viewing from a mountaintop)
         max_load = 2 if rd <= 3 else 4
         loaded = 0
 
-        # Prioritise normal full-detail chunks
+        # Prioritise normal full-detail chunks.  Cache hits are free and
+        # do not count against the per-frame generation budgets.
         for key in needed:
             if key not in self.chunks:
-                self.chunks[key] = ForestChunk(
-                    key[0], key[1], cs, self.seed)
-                loaded += 1
-                if loaded >= max_load:
-                    break
+                if self._load_chunk(key, False):
+                    loaded += 1
+                    if loaded >= max_load:
+                        break
 
         # Then load intermediate terrain-only chunks (cheap, coarse grid).
         terrain_loaded = 0
         terrain_max = 8
         for key in terrain_needed:
             if key not in self.chunks:
-                self.chunks[key] = ForestChunk(
-                    key[0], key[1], cs, self.seed, terrain_only=True)
-                terrain_loaded += 1
-                if terrain_loaded >= terrain_max:
-                    break
+                if self._load_chunk(key, True):
+                    terrain_loaded += 1
+                    if terrain_loaded >= terrain_max:
+                        break
 
         # Then load distant mountain chunks (terrain-only).
         # These are much cheaper to generate (no objects), so allow a
@@ -1130,11 +1634,27 @@ class ForestWorld:
         mtn_max = 8
         for key in mtn_needed:
             if key not in self.chunks:
-                self.chunks[key] = ForestChunk(
-                    key[0], key[1], cs, self.seed, terrain_only=True)
-                mtn_loaded += 1
-                if mtn_loaded >= mtn_max:
-                    break
+                if self._load_chunk(key, True):
+                    mtn_loaded += 1
+                    if mtn_loaded >= mtn_max:
+                        break
+
+        # Until every tier is resident the loops above keep running; once
+        # it is, update() is a no-op until the camera changes chunk.
+        self._tiers_loaded = len(self.chunks) == len(all_needed)
+
+    def _load_chunk(self, key: tuple, terrain_only: bool) -> bool:
+        """Install chunk *key*, reusing an evicted copy when one is cached.
+
+        Returns ``True`` if the chunk had to be generated.
+        """
+        chunk = self._chunk_cache.pop((key[0], key[1], terrain_only), None)
+        generated = chunk is None
+        if generated:
+            chunk = ForestChunk(key[0], key[1], self.chunk_size, self.seed,
+                                terrain_only=terrain_only)
+        self.chunks[key] = chunk
+        return generated
 
     # -- face data for the renderer -----------------------------------------
 
@@ -1158,58 +1678,29 @@ class ForestWorld:
         mtn_render_dist = cs * 10.0     # ~120 world units
         mtn_dist_sq = mtn_render_dist * mtn_render_dist
 
-        for (cx, cz), chunk in self.chunks.items():
-            # Chunk centre in world space
-            ccx = cx * cs + cs * 0.5
-            ccz = cz * cs + cs * 0.5
+        behind = -cs * 1.5
+        extend = result.extend
 
+        # Single pass over the chunks: both culls use the centre stored on
+        # the chunk, and survivors are appended straight away.
+        for chunk in self.chunks.values():
             # Vector from camera to chunk centre
-            dx = ccx - cam_px
-            dz = ccz - cam_pz
-
-            # Dot product with camera forward (XZ only)
-            dot_fwd = dx * fwd_x + dz * fwd_z
+            dx = chunk.center_x - cam_px
+            dz = chunk.center_z - cam_pz
 
-            # Skip chunks entirely behind camera (generous margin)
-            if dot_fwd < -cs * 1.5:
+            # Skip chunks entirely behind camera (generous margin), using
+            # the XZ dot product with camera forward
+            if dx * fwd_x + dz * fwd_z < behind:
                 continue
 
             # Terrain-only mountain chunks: cull if too far for wireframe
-            if chunk.terrain_only:
-                if dx * dx + dz * dz > mtn_dist_sq:
-                    continue
+            if chunk.terrain_only and dx * dx + dz * dz > mtn_dist_sq:
+                continue
 
-            result.extend(chunk.face_data)
+            extend(chunk.face_data)
 
-        # Add yellow path from spawn to special tree
-        if self.special_tree_pos is not None and self._special_tree_spawned:
-            wx, wz, base_y = self.special_tree_pos
-            spawn_x, spawn_y, spawn_z = self.spawn_pos.x, self.spawn_pos.y, self.spawn_pos.z
-            
-            # Generate path as a series of small markers along the path
-            path_length = math.sqrt((wx - spawn_x)**2 + (wz - spawn_z)**2)
-            num_markers = int(path_length / 1.5)  # One marker every 1.5 units for denser path
-            
-            # Yellow edge color for path markers - bright golden yellow
-            PATH_EDGE = '\033[38;2;255;255;0m#\033[0m'  # Bright yellow (#FFFF00)
-            
-            for i in range(num_markers + 1):
-                t = i / max(num_markers, 1)
-                px = spawn_x + t * (wx - spawn_x)
-                pz = spawn_z + t * (wz - spawn_z)
-                py = terrain_height(px, pz, self.seed) + 0.01
-                
-                # Diamond shape marker on ground - larger for visibility
-                marker_size = 0.6
-                v0 = Vec3(px, py, pz - marker_size)
-                v1 = Vec3(px + marker_size, py, pz)
-                v2 = Vec3(px, py, pz + marker_size)
-                v3 = Vec3(px - marker_size, py, pz)
-                
-                # Create quad face WITH yellow wireframe marker
-                face = _make_face([v0, v1, v2, v3])
-                # Add 4th element with yellow edge - wireframe-only rendering
-                result.append((face[0], face[1], face[2], PATH_EDGE))
+        # Add yellow path from spawn to special tree (built once at spawn)
+        result.extend(self._path_face_data)
 
         # Add special tree (golden oak) - rendered as filled faces (no wireframe marker)
         if self.special_tree_face_data is not None:
@@ -1297,6 +1788,16 @@ class Renderer:
     CHAR_ASPECT = 2.0
     EDGE_STR = '\033[38;2;159;239;0m#\033[0m'
 
+    # Fog-faded edge strings, indexed by fade quantised to 0..FOG_LEVELS.
+    # Built once here instead of formatted lazily per frame.
+    FOG_LEVELS = 20
+    WIRE_FOG_EDGES = tuple(
+        f'\033[38;2;{int(60*q*0.05)};{int(90*q*0.05)};{int(45*q*0.05)}m.\033[0m'
+        for q in range(21))
+    SOLID_FOG_EDGES = tuple(
+        f'\033[38;2;{int(159*q*0.05)};{int(239*q*0.05)};0m#\033[0m'
+        for q in range(21))
+
     def __init__(self, width: int, height: int, model=None):
         self.width = width
         self.height = height
@@ -1315,6 +1816,11 @@ class Renderer:
         self.focal = width * 0.8          # recalculated by set_fov()
         self.draw_edges = True            # toggle wireframe edges
         self.fog_distance = 0.0           # 0 = no fog; >0 = fade starts here
+        # Char and depth buffers, reused across frames (see _clear_buffers)
+        self._blank_row = [' '] * width
+        self._far_row = [-1e30] * width
+        self._buffer = [[' '] * width for _ in range(height)]
+        self._zbuffer = [[-1e30] * width for _ in range(height)]
 
     def set_fov(self, fov_degrees: float):
         """Set the horizontal field of view (degrees) for perspective mode."""
@@ -1336,6 +1842,23 @@ class Renderer:
             return self._render_perspective(model, camera)
         return self._render_ortho(model)
 
+    def _clear_buffers(self) -> tuple:
+        """Reset and return the reused (buffer, zbuffer) pair.
+
+        Rows are refilled in place by slice assignment rather than
+        reallocated, so a frame costs no new row lists.  The returned
+        buffer is only valid until the next render() call.
+        """
+        blank = self._blank_row
+        far = self._far_row
+        buffer = self._buffer
+        zbuffer = self._zbuffer
+        for row in buffer:
+            row[:] = blank
+        for row in zbuffer:
+            row[:] = far
+        return buffer, zbuffer
+
     # ── orthographic path (original) ───────────────────────────────────────
 
     def _project_vertex_ortho(self, v: Vec3) -> 'tuple | None':
@@ -1348,31 +1871,42 @@ class Renderer:
         return None
 
     def _render_ortho(self, model: Model) -> list:
-        """Render with orthographic projection (spin mode)."""
+        """Render with orthographic projection (spin mode).
+
+        Each vertex is projected once per frame (model faces share their
+        vertices) and the result is reused by both the fill and edge passes.
+        """
+        _proj = self._project_vertex_ortho
+        proj_cache = {}
         visible = []
         for vs, center, normal in model.get_face_data():
             if normal.z > 0:
-                visible.append((vs, center, normal))
-
-        buffer = [[' '] * self.width for _ in range(self.height)]
-        zbuffer = [[-1e30] * self.width for _ in range(self.height)]
-
-        for vs, center, normal in visible:
-            projected = [self._project_vertex_ortho(v) for v in vs]
-            if all(projected):
-                self._draw_face_lit_ortho(buffer, zbuffer, projected,
-                                          vs[0], normal)
-
-        for vs, center, normal in visible:
-            projected = [self._project_vertex_ortho(v) for v in vs]
-            if all(projected):
-                n = len(projected)
-                for i in range(n):
-                    j = (i + 1) % n
-                    self._draw_line(buffer, zbuffer,
-                                    projected[i], projected[j],
-                                    vs[i].z, vs[j].z,
-                                    self.EDGE_STR, z_bias=0.005)
+                projected = []
+                for v in vs:
+                    if v in proj_cache:
+                        p = proj_cache[v]
+                    else:
+                        p = proj_cache[v] = _proj(v)
+                    projected.append(p)
+                if all(projected):
+                    visible.append((vs, normal, projected))
+
+        buffer, zbuffer = self._clear_buffers()
+
+        for vs, normal, projected in visible:
+            self._draw_face_lit_ortho(buffer, zbuffer, projected,
+                                      vs[0], normal)
+
+        _draw_line = self._draw_line
+        edge_str = self.EDGE_STR
+        for vs, normal, projected in visible:
+            n = len(projected)
+            for i in range(n):
+                j = (i + 1) % n
+                _draw_line(buffer, zbuffer,
+                           projected[i], projected[j],
+                           vs[i].z, vs[j].z,
+                           edge_str, z_bias=0.005)
         return buffer
 
     def _draw_face_lit_ortho(self, buffer, zbuffer, projected, v0, normal):
@@ -1392,41 +1926,101 @@ class Renderer:
         nx, ny, nz = normal.x, normal.y, normal.z
         nz_inv = 1.0 / nz if abs(nz) > 1e-10 else 0.0
         v0x, v0y, v0z = v0.x, v0.y, v0.z
+        # Face plane solved for depth: wz = pa*wx + pb*wy + pc
+        pa = -nx * nz_inv
+        pb = -ny * nz_inv
+        pc = v0z + (nx * v0x + ny * v0y) * nz_inv
+        dz_dx = pa * inv_scale              # depth step per pixel column
 
         lx, ly, lz = self.light_pos.x, self.light_pos.y, self.light_pos.z
         shading = self.SHADING
         num_shades = len(shading) - 1
         ambient = self.ambient
         _sqrt = math.sqrt
-        n_verts = len(projected)
+
+        # Edge functions of the _point_in_polygon test:
+        #   d_i(x, y) = (x - bx)*(ay - by) - (ax - bx)*(y - by)
+        # A pixel is inside when no two d_i have opposite signs.  Every d_i
+        # is linear in x, so each row's inside pixels form at most two
+        # integer spans (all d_i >= 0, all d_i <= 0), found exactly with
+        # integer floor division instead of testing every pixel.
+        edges = [(ay - by, ax - bx, bx, by)
+                 for (ax, ay), (bx, by) in zip(projected,
+                                               projected[1:] + projected[:1])]
 
         for y in range(ymin, ymax + 1):
             wy = -(y - cy) * self.CHAR_ASPECT * inv_scale
-            for x in range(xmin, xmax + 1):
-                if self._point_in_polygon(x, y, projected, n_verts):
-                    wx = (x - cx) * inv_scale
-                    wz = v0z - (nx * (wx - v0x) + ny * (wy - v0y)) * nz_inv
+            pos_lo, pos_hi = xmin, xmax       # span where all d_i >= 0
+            neg_lo, neg_hi = xmin, xmax       # span where all d_i <= 0
+            for a, b, bx, by in edges:
+                # d_i = a*x + c
+                c = -a * bx - b * (y - by)
+                if a > 0:
+                    lo = -(c // a)                   # ceil(-c / a)
+                    hi = (-c) // a                   # floor(-c / a)
+                    if lo > pos_lo:
+                        pos_lo = lo
+                    if hi < neg_hi:
+                        neg_hi = hi
+                elif a < 0:
+                    hi = (-c) // a                   # floor(-c / a)
+                    lo = -(c // a)                   # ceil(-c / a)
+                    if hi < pos_hi:
+                        pos_hi = hi
+                    if lo > neg_lo:
+                        neg_lo = lo
+                else:
+                    if c < 0:
+                        pos_lo, pos_hi = 1, 0        # empty
+                    elif c > 0:
+                        neg_lo, neg_hi = 1, 0
+            if pos_lo > pos_hi:
+                spans = ((neg_lo, neg_hi),)
+            elif neg_lo > neg_hi or (neg_lo >= pos_lo and neg_hi <= pos_hi):
+                spans = ((pos_lo, pos_hi),)
+            elif neg_hi < pos_lo - 1 or neg_lo > pos_hi + 1:
+                spans = ((pos_lo, pos_hi), (neg_lo, neg_hi))
+            else:
+                spans = ((min(pos_lo, neg_lo), max(pos_hi, neg_hi)),)
 
-                    if wz < zbuffer[y][x]:
+            row_c = pb * wy + pc
+            zbuf_row = zbuffer[y]
+            buf_row = buffer[y]
+            for span_lo, span_hi in spans:
+                # Step wx and wz along the span instead of re-deriving them
+                wx = (span_lo - cx) * inv_scale - inv_scale
+                wz = pa * wx + row_c
+                for x in range(span_lo, span_hi + 1):
+                    wx += inv_scale
+                    wz += dz_dx
+
+                    if wz < zbuf_row[x]:
                         continue
-                    zbuffer[y][x] = wz
+                    zbuf_row[x] = wz
 
                     dx = lx - wx
                     dy = ly - wy
                     dz = lz - wz
-                    dist = _sqrt(dx * dx + dy * dy + dz * dz)
-                    if dist > 0:
-                        inv_d = 1.0 / dist
-                        diffuse = max(0.0, nx * dx * inv_d
-                                       + ny * dy * inv_d
-                                       + nz * dz * inv_d)
-                        atten = 1.0 / (1.0 + 0.02 * dist * dist)
-                        brightness = ambient + (1.0 - ambient) * diffuse * atten
+                    dist2 = dx * dx + dy * dy + dz * dz
+                    if dist2 > 0:
+                        # Sign-test the unnormalised N·L; normalise (one
+                        # sqrt) only for lit pixels, attenuate by dist².
+                        diffuse = nx * dx + ny * dy + nz * dz
+                        if diffuse > 0.0:
+                            diffuse /= _sqrt(dist2)
+                            atten = 1.0 / (1.0 + 0.02 * dist2)
+                            brightness = (ambient
+                                          + (1.0 - ambient) * diffuse * atten)
+                        else:
+                            brightness = ambient
                     else:
                         brightness = 1.0
 
+                    # brightness is never negative here (ambient >= 0),
+                    # so only the top end needs clamping
                     idx = int(brightness * num_shades)
-                    buffer[y][x] = shading[max(0, min(num_shades, idx))]
+                    buf_row[x] = shading[idx if idx < num_shades
+                                         else num_shades]
 
     # ── perspective path (movement mode) ───────────────────────────────────
 
@@ -1441,10 +2035,7 @@ class Renderer:
         behind the near plane.
         """
         out = []
-        n = len(cam_vs)
-        for i in range(n):
-            cur = cam_vs[i]
-            nxt = cam_vs[(i + 1) % n]
+        for cur, nxt in zip(cam_vs, cam_vs[1:] + cam_vs[:1]):
             cur_in = cur[2] > near
             nxt_in = nxt[2] > near
             if cur_in:
@@ -1494,8 +2085,10 @@ class Renderer:
             inlined to eliminate per-vertex method-dispatch overhead.
           • Vertices projected once and stored — reused by both the fill and
             edge passes (previously every face was projected twice).
-          • Fog-faded edge ANSI strings cached by quantised fog level so
-            identical strings are shared across hundreds of terrain faces.
+          • Each shared vertex transformed and projected once per frame, not
+            once per face that uses it.
+          • Fog-faded edge ANSI strings looked up by quantised fog level from
+            prebuilt tables, shared across hundreds of terrain faces.
         """
         near = self.near_plane
 
@@ -1518,32 +2111,86 @@ class Renderer:
         visible = []
         _clip = self._clip_polygon_near
         _proj = self._project_vertex_persp
+        # (camera-space vertex, projection) for this frame, keyed by Vec3
+        # identity: terrain grid points are shared by up to four quads and
+        # model vertices by every face around them, so each is transformed
+        # and projected once.  Projection is _project_vertex_persp inlined.
+        vert_cache = {}
+        vert_get = vert_cache.get
+        focal = self.focal
+        half_w = self.width // 2
+        half_h = self.height // 2
+        aspect = self.CHAR_ASPECT
+        limit = max(self.width, self.height) * 10
+        scr_w = self.width
+        scr_h = self.height
 
         for item in model.get_face_data():
             vs = item[0]
             normal = item[2]
             wireframe = item[3] if len(item) > 3 else None
+            edges = item[4] if len(item) > 4 else None
             world_y = item[1].y
 
             # Inline view_transform — replaces camera.view_transform() calls
             cam_vs = []
-            any_in_front = False
+            projected = []
+            n_in_front = 0
             for v in vs:
-                dx = v.x - cpx
-                dy = v.y - cpy
-                dz = v.z - cpz
-                cz = cfx * dx + cfy * dy + cfz * dz
-                if cz > near:
-                    any_in_front = True
-                cam_vs.append((crx * dx + cry * dy + crz * dz,
-                               cux * dx + cuy * dy + cuz * dz,
-                               cz))
-
-            if not any_in_front:
+                entry = vert_get(v)
+                if entry is None:
+                    dx = v.x - cpx
+                    dy = v.y - cpy
+                    dz = v.z - cpz
+                    cx = crx * dx + cry * dy + crz * dz
+                    cy = cux * dx + cuy * dy + cuz * dz
+                    cz = cfx * dx + cfy * dy + cfz * dz
+                    if cz > near:
+                        sx = round(focal * cx / cz + half_w)
+                        sy = round(-focal * cy / (cz * aspect) + half_h)
+                        sp = (max(-limit, min(limit, sx)),
+                              max(-limit, min(limit, sy)))
+                    else:
+                        sp = None
+                    entry = vert_cache[v] = ((cx, cy, cz), sp)
+                cv, sp = entry
+                if sp is not None:
+                    n_in_front += 1
+                cam_vs.append(cv)
+                projected.append(sp)
+
+            if not n_in_front:
                 continue
 
-            clipped = _clip(cam_vs, near)
-            if len(clipped) < 3:
+            # Only faces straddling the near plane need clipping; a face
+            # wholly in front would come back from the clipper unchanged.
+            if n_in_front == len(cam_vs):
+                clipped = cam_vs
+            else:
+                # Clipping renumbers the edges: draw all of them
+                edges = None
+                clipped = _clip(cam_vs, near)
+                if len(clipped) < 3:
+                    continue
+                projected = [_proj(cv) for cv in clipped]
+                if not all(projected):
+                    continue
+
+            # Screen-rectangle cull: a face whose projection lies wholly
+            # beyond one screen edge can neither fill nor draw an edge
+            # pixel, so drop it before the normal transform and draw calls.
+            sx_min = sx_max = projected[0][0]
+            sy_min = sy_max = projected[0][1]
+            for sx, sy in projected:
+                if sx < sx_min:
+                    sx_min = sx
+                elif sx > sx_max:
+                    sx_max = sx
+                if sy < sy_min:
+                    sy_min = sy
+                elif sy > sy_max:
+                    sy_max = sy
+            if sx_max < 0 or sx_min >= scr_w or sy_max < 0 or sy_min >= scr_h:
                 continue
 
             # Inline transform_direction for normal
@@ -1552,19 +2199,14 @@ class Renderer:
                      cux * nx + cuy * ny + cuz * nz,
                      cfx * nx + cfy * ny + cfz * nz)
 
-            # Project once — reused by both fill and edge passes
-            projected = [_proj(cv) for cv in clipped]
-            if not all(projected):
-                continue
-
-            visible.append((clipped, cam_n, wireframe, world_y, projected))
+            visible.append((clipped, cam_n, wireframe, world_y, projected,
+                            edges, vs))
 
         # ── Draw ─────────────────────────────────────────────────────────
-        buffer = [[' '] * self.width for _ in range(self.height)]
-        zbuffer = [[-1e30] * self.width for _ in range(self.height)]
+        buffer, zbuffer = self._clear_buffers()
 
         # Filled faces (skip wireframe-only faces)
-        for cam_vs, cam_n, wireframe, world_y, projected in visible:
+        for cam_vs, cam_n, wireframe, world_y, projected, _, _ in visible:
             if wireframe is not None:
                 continue
             self._draw_face_lit_persp(buffer, zbuffer, projected,
@@ -1575,12 +2217,41 @@ class Renderer:
         fog_dist = self.fog_distance
         draw_edges = self.draw_edges
         _draw_line = self._draw_line
-        edge_cache = {}       # (is_wire, quantised_fade) → ANSI string
+        fog_levels = self.FOG_LEVELS
+        wire_edges = self.WIRE_FOG_EDGES
+        solid_edges = self.SOLID_FOG_EDGES
 
-        for cam_vs, cam_n, wireframe, world_y, projected in visible:
+        for (cam_vs, cam_n, wireframe, world_y, projected, edges,
+             vs) in visible:
             if wireframe is None and not draw_edges:
                 continue
 
+            if edges is not None:
+                # Terrain quads draw only the grid edges they own, so each
+                # edge is fogged from its own two endpoints (as the quad
+                # fog is from its corners); a fogged-out owner must not
+                # take a still-visible neighbour's shared edge with it.
+                nv = len(projected)
+                for i in edges:
+                    j = (i + 1) % nv
+                    if fog_dist > 0:
+                        fog = min(1.0, ((cam_vs[i][2] + cam_vs[j][2]) * 0.5)
+                                  / fog_dist)
+                        edge_y = (vs[i].y + vs[j].y) * 0.5
+                        if edge_y > 4.0:
+                            alt = min(1.0, (edge_y - 4.0) / 15.0)
+                            fog *= 1.0 - alt * 0.92
+                        fog_fade = max(0.0, 1.0 - fog * fog)
+                        if fog_fade < 0.03:
+                            continue
+                    else:
+                        fog_fade = 1.0
+                    _draw_line(buffer, zbuffer,
+                               projected[i], projected[j],
+                               -cam_vs[i][2], -cam_vs[j][2],
+                               wire_edges[int(fog_fade * fog_levels)])
+                continue
+
             # Fog fade
             if fog_dist > 0:
                 n_cv = len(cam_vs)
@@ -1601,26 +2272,19 @@ class Renderer:
             else:
                 fog_fade = 1.0
 
-            # Quantised edge-string cache (21 levels per type, shared across
-            # hundreds of terrain faces to avoid per-face f-string allocation)
+            # Quantised edge strings (21 levels per type, shared across
+            # hundreds of terrain faces via the class-level tables)
             is_wire = wireframe is not None
             
             # If wireframe marker is provided (like yellow path), use it directly
             # Only apply fog fade to terrain wireframe (not special markers)
-            if is_wire and wireframe != '\033[38;2;60;90;45m.\033[0m':
+            if is_wire and wireframe != TERRAIN_EDGE:
                 # Special wireframe marker (e.g., yellow path) - preserve original color
                 edge_str = wireframe
+            elif is_wire:
+                edge_str = wire_edges[int(fog_fade * fog_levels)]
             else:
-                q = int(fog_fade * 20)
-                cache_key = (is_wire, q)
-                edge_str = edge_cache.get(cache_key)
-                if edge_str is None:
-                    ff = q * 0.05
-                    if is_wire:
-                        edge_str = f'\033[38;2;{int(60*ff)};{int(90*ff)};{int(45*ff)}m.\033[0m'
-                    else:
-                        edge_str = f'\033[38;2;{int(159*ff)};{int(239*ff)};0m#\033[0m'
-                    edge_cache[cache_key] = edge_str
+                edge_str = solid_edges[int(fog_fade * fog_levels)]
 
             z_bias = 0.0 if is_wire else 0.005
             nv = len(projected)
@@ -1680,41 +2344,43 @@ class Renderer:
         _sqrt = math.sqrt
         near = self.near_plane
         fog_dist = self.fog_distance
-        fog_height_factor = 1.0
-
-        # ── Build edge table (non-horizontal edges, sorted top→bottom) ──
-        edges = []
-        for i in range(n_verts):
-            j = (i + 1) % n_verts
-            x0, y0 = projected[i]
-            x1, y1 = projected[j]
+        fogged = fog_dist > 0
+
+        # ── Span table: walk each edge over only the rows it covers ──────
+        # Edge-major instead of testing every edge on every scanline;
+        # each crossing is still ex0 + (y - ey0) * slope.
+        n_rows = ymax - ymin + 1
+        lefts = [1e9] * n_rows
+        rights = [-1e9] * n_rows
+        for (x0, y0), (x1, y1) in zip(projected,
+                                      projected[1:] + projected[:1]):
             if y0 == y1:
                 continue
             if y0 > y1:
                 x0, y0, x1, y1 = x1, y1, x0, y0
-            edges.append((x0, y0, x1, y1, (x1 - x0) / (y1 - y0)))
+            slope = (x1 - x0) / (y1 - y0)
+            for y in range(y0 if y0 > ymin else ymin,
+                           (y1 if y1 < ymax else ymax) + 1):
+                ix = x0 + (y - y0) * slope
+                r = y - ymin
+                if ix < lefts[r]:
+                    lefts[r] = ix
+                if ix > rights[r]:
+                    rights[r] = ix
+
+        # Include vertices exactly on a scanline (handles tips)
+        for vx, vy in projected:
+            if ymin <= vy <= ymax:
+                r = vy - ymin
+                if vx < lefts[r]:
+                    lefts[r] = vx
+                if vx > rights[r]:
+                    rights[r] = vx
 
         # ── Scanline fill ────────────────────────────────────────────────
         for y in range(ymin, ymax + 1):
-            x_left = 1e9
-            x_right = -1e9
-
-            for ex0, ey0, ex1, ey1, slope in edges:
-                if ey0 <= y <= ey1:
-                    ix = ex0 + (y - ey0) * slope
-                    if ix < x_left:
-                        x_left = ix
-                    if ix > x_right:
-                        x_right = ix
-
-            # Include vertices exactly at this scanline (handles tips)
-            for i in range(n_verts):
-                if projected[i][1] == y:
-                    vx = projected[i][0]
-                    if vx < x_left:
-                        x_left = vx
-                    if vx > x_right:
-                        x_right = vx
+            x_left = lefts[y - ymin]
+            x_right = rights[y - ymin]
 
             xl = int(x_left) if x_left >= 0 else 0
             if xl < 0:
@@ -1729,11 +2395,14 @@ class Renderer:
             buf_row = buffer[y]
             zbuf_row = zbuffer[y]
 
+            cy_ry = cny * ry
+            # Per-pixel body with the builtin calls (abs/max/min) replaced
+            # by comparisons; the float expressions are unchanged.
             for x in range(xl, xr + 1):
                 rx = (x - scx) * inv_focal
 
-                denom = cnx * rx + cny * ry + cnz
-                if abs(denom) < 1e-10:
+                denom = cnx * rx + cy_ry + cnz
+                if -1e-10 < denom < 1e-10:
                     continue
                 cam_z = d / denom
                 if cam_z <= near:
@@ -1744,41 +2413,56 @@ class Renderer:
                     continue
                 zbuf_row[x] = zbuf_z
 
-                cam_x = rx * cam_z
-                cam_y = ry * cam_z
-
-                dlx = lcx - cam_x
-                dly = lcy - cam_y
+                dlx = lcx - rx * cam_z
+                dly = lcy - ry * cam_z
                 dlz = lcz - cam_z
-                dist = _sqrt(dlx * dlx + dly * dly + dlz * dlz)
-                if dist > 0:
-                    inv_d = 1.0 / dist
-                    diffuse = max(0.0, cnx * dlx * inv_d
-                                   + cny * dly * inv_d
-                                   + cnz * dlz * inv_d)
-                    atten = 1.0 / (1.0 + 0.02 * dist * dist)
-                    brightness = ambient + (1.0 - ambient) * diffuse * atten
+                dist2 = dlx * dlx + dly * dly + dlz * dlz
+                if dist2 > 0:
+                    # Sign-test the unnormalised N·L; normalise (one sqrt)
+                    # only for lit pixels, attenuate by dist² directly.
+                    diffuse = cnx * dlx + cny * dly + cnz * dlz
+                    if diffuse > 0.0:
+                        diffuse /= _sqrt(dist2)
+                        atten = 1.0 / (1.0 + 0.02 * dist2)
+                        brightness = (ambient
+                                      + (1.0 - ambient) * diffuse * atten)
+                    else:
+                        brightness = ambient
                 else:
                     brightness = 1.0
 
-                if fog_dist > 0:
-                    fog = min(1.0, cam_z / fog_dist) * fog_height_factor
+                if fogged:
+                    fog = cam_z / fog_dist
+                    if fog > 1.0:
+                        fog = 1.0
                     brightness *= (1.0 - fog * fog)
-
-                idx = int(brightness * num_shades)
-                if idx <= 0 and fog_dist > 0:
-                    continue
-                buf_row[x] = shading[max(0, min(num_shades, idx))]
+                    idx = int(brightness * num_shades)
+                    if idx <= 0:
+                        continue
+                else:
+                    idx = int(brightness * num_shades)
+                    if idx < 0:
+                        idx = 0
+                buf_row[x] = shading[idx if idx < num_shades else num_shades]
 
     # ── shared helpers ─────────────────────────────────────────────────────
 
     def _draw_line(self, buffer, zbuffer, p1, p2, z1, z2, char, z_bias=0.0):
         """Bresenham line with per-pixel z-buffer depth test.
 
-        Uses incremental z instead of per-step division for speed.
+        Uses incremental z instead of per-step division for speed.  Clipped
+        faces can put endpoints far off-screen, so the walk jumps straight
+        to the first step that can be on-screen (the Bresenham state after
+        k steps has a closed form) and stops at the first step that leaves
+        it again; the pixels drawn are exactly those of the full walk.
         """
         x1, y1 = p1
         x2, y2 = p2
+        w = self.width
+        h = self.height
+        if ((x1 < 0 and x2 < 0) or (x1 >= w and x2 >= w)
+                or (y1 < 0 and y2 < 0) or (y1 >= h and y2 >= h)):
+            return
         dx, dy = abs(x2 - x1), abs(y2 - y1)
         sx = 1 if x1 < x2 else -1
         sy = 1 if y1 < y2 else -1
@@ -1786,14 +2470,36 @@ class Renderer:
         total = max(dx, dy)
         z = z1 + z_bias
         z_inc = (z2 - z1) / total if total > 0 else 0.0
-        w = self.width
-        h = self.height
-        while True:
-            if 0 <= x1 < w and 0 <= y1 < h:
-                zbuf_row = zbuffer[y1]
-                if z >= zbuf_row[x1]:
-                    zbuf_row[x1] = z
-                    buffer[y1][x1] = char
+
+        # Steps each axis needs to reach the screen edge it starts beyond
+        gx = -x1 if x1 < 0 else (x1 - w + 1 if x1 >= w else 0)
+        gy = -y1 if y1 < 0 else (y1 - h + 1 if y1 >= h else 0)
+        if gx or gy:
+            # After k steps the major axis has moved k and the minor one
+            # (2*k*minor + major - 1) // (2*major); invert for the minor gap.
+            if dx >= dy:
+                k = gx
+                if gy:
+                    k = max(k, (2 * gy * dx - dx + 2 * dy) // (2 * dy))
+                mx, my = k, (2 * k * dy + dx - 1) // (2 * dx)
+            else:
+                k = gy
+                if gx:
+                    k = max(k, (2 * gx * dy - dy + 2 * dx) // (2 * dx))
+                mx, my = (2 * k * dx + dy - 1) // (2 * dy), k
+            x1 += sx * mx
+            y1 += sy * my
+            err += my * dx - mx * dy
+            for _ in range(k):          # same float sum as the full walk
+                z += z_inc
+
+        # Both coordinates are monotonic, so once on-screen the line stays
+        # on-screen until it leaves for good.
+        while 0 <= x1 < w and 0 <= y1 < h:
+            zbuf_row = zbuffer[y1]
+            if z >= zbuf_row[x1]:
+                zbuf_row[x1] = z
+                buffer[y1][x1] = char
             if x1 == x2 and y1 == y2:
                 break
             e2 = 2 * err
@@ -1822,7 +2528,34 @@ class Renderer:
         return True
 
     def buffer_to_string(self, buffer):
-        return '\n'.join(''.join(row) for row in buffer)
+        """Join *buffer* into one frame string (see buffer_to_lines)."""
+        return '\n'.join(self.buffer_to_lines(buffer))
+
+    def buffer_to_lines(self, buffer):
+        """Return one output string per row of *buffer*.
+
+        Coloured cells are ``SGR + char + reset``.  Runs of identical cells
+        are emitted as one SGR, the repeated char and a single reset, which
+        keeps wireframe-heavy frames several times smaller for the terminal
+        to parse.
+        """
+        groupby = itertools.groupby
+        lines = []
+        for row in buffer:
+            parts = []
+            append = parts.append
+            for cell, run in groupby(row):
+                if len(cell) == 1:
+                    append(cell * len(list(run)))
+                else:
+                    n = len(list(run))
+                    if n == 1:
+                        append(cell)
+                    else:
+                        # cell[-5] is the glyph, cell[-4:] the '\033[0m' reset
+                        append(cell[:-5] + cell[-5] * n + cell[-4:])
+            lines.append(''.join(parts))
+        return lines
 
 
 # ---------------------------------------------------------------------------
@@ -1892,6 +2625,9 @@ class SpinningModel:
         self._key_state = {}        # key name → last-press timestamp
         self._key_timeout = 0.25    # seconds before a key is considered released
 
+        self._last_frame_key = None  # _frame_key() of the frame on screen
+        self._prev_lines = None      # output rows of the frame on screen
+
         signal.signal(signal.SIGINT, self._signal_handler)
         signal.signal(signal.SIGTERM, self._signal_handler)
 
@@ -1996,7 +2732,32 @@ class SpinningModel:
                 self.args.speed_z if self.args.rotate_z else 0,
             )
 
+    def _frame_key(self):
+        """Everything the next frame depends on, or ``None`` if it animates.
+
+        Spin mode rotates the model every update, so it always redraws.
+        In move and forest mode the frame is a function of the camera, the
+        projection settings and (forest) the set of loaded chunks, which
+        only changes size between frames while tiers are still loading.
+        """
+        if self.mode == 'rotate':
+            return None
+        cam = self.camera
+        cp = cam.position
+        r = self.renderer
+        key = (self.mode, cp.x, cp.y, cp.z, cam.yaw, cam.pitch,
+               r.focal, r.fog_distance, r.draw_edges)
+        if self.forest_mode:
+            key += (self.world.render_distance, len(self.world.chunks))
+        return key
+
     def render(self):
+        # Skip the whole render + write while the scene is standing still
+        key = self._frame_key()
+        if key is not None and key == self._last_frame_key:
+            return
+        self._last_frame_key = key
+
         if self.forest_mode:
             buffer = self.renderer.render(self.world, camera=self.camera)
         elif self.mode == 'move':
@@ -2023,11 +2784,32 @@ class SpinningModel:
         else:
             status = "\033[7m SPIN \033[0m Tab=move Q=quit"
 
-        out = '\033[H'                  # cursor home (no full clear → less flicker)
-        out += self.renderer.buffer_to_string(buffer)
-        out += '\n' + status + '\033[K'  # \033[K = clear to end of line
-        sys.stdout.write(out)
-        sys.stdout.flush()
+        lines = self.renderer.buffer_to_lines(buffer)
+        lines.append(status + '\033[K')  # \033[K = clear to end of line
+
+        # Only rows that differ from the frame on screen are rewritten, each
+        # behind a cursor-position escape; the first frame is sent whole.
+        prev = self._prev_lines
+        self._prev_lines = lines
+        if prev is None or len(prev) != len(lines):
+            # cursor home (no full clear → less flicker)
+            out = '\033[H' + '\n'.join(lines)
+        else:
+            out = ''.join([f'\033[{y};1H{line}'
+                           for y, (line, old) in enumerate(zip(lines, prev), 1)
+                           if line != old])
+            if not out:
+                return
+        # Encode the frame once and hand it straight to the binary layer
+        # instead of going through the text wrapper.
+        raw = getattr(sys.stdout, 'buffer', None)
+        if raw is not None:
+            sys.stdout.flush()
+            raw.write(out.encode(sys.stdout.encoding or 'utf-8'))
+            raw.flush()
+        else:
+            sys.stdout.write(out)
+            sys.stdout.flush()
 
     def run(self):
         self._setup_keyboard()
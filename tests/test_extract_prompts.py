@@ -0,0 +1,156 @@
+import os
+import random
+import re
+import sys
+import tempfile
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import extract_prompts  # noqa: E402
+
+
+def reference_completion_result(content):
+    """extract_completion_result() as originally written, one re call per step."""
+    match = re.search(r'Result:\s*(.*?)(?=\n\n\[|\n\n\*Tools|\Z)', content, re.DOTALL)
+    if match:
+        result = match.group(1).strip()
+        result = re.sub(r'\[`([^`]+)`\]\([^)]+\)', r'`\1`', result)
+        result = re.sub(r'\[([^\]]+)\]\([^)]+\)', r'\1', result)
+        result = re.sub(r'```[\s\S]*?```', '', result)
+        lines = result.split('\n')
+        bullet_count = 0
+        filtered_lines = []
+        skipped_bullets = 0
+        for line in lines:
+            if re.match(r'^\s*[-*•]\s', line):
+                bullet_count += 1
+                if bullet_count <= 5:
+                    filtered_lines.append(line)
+                else:
+                    skipped_bullets += 1
+            else:
+                if skipped_bullets > 0:
+                    filtered_lines.append(f"  *(... {skipped_bullets} more items)*")
+                    skipped_bullets = 0
+                bullet_count = 0
+                filtered_lines.append(line)
+        if skipped_bullets > 0:
+            filtered_lines.append(f"  *(... {skipped_bullets} more items)*")
+        result = '\n'.join(filtered_lines)
+        result = re.sub(r'\n{3,}', '\n\n', result).strip()
+        if len(result) > 800:
+            truncated = result[:800]
+            cut = max(truncated.rfind('.'), truncated.rfind('\n'))
+            if cut > 400:
+                truncated = truncated[:cut + 1]
+            result = truncated.rstrip() + "\n\n*(truncated)*"
+        return result
+    return None
+
+
+def reference_iter_messages(path):
+    """iter_messages() over a text-mode (universal newlines) file."""
+    role = None
+    content = []
+    part_lines = []
+    with open(path, 'r', encoding='utf-8') as f:
+        for line in list(f) + ['---']:
+            if line.rstrip() != '---':
+                part_lines.append(line)
+                continue
+            part = "".join(part_lines).strip()
+            part_lines = []
+            if not part:
+                continue
+            if part.startswith("**User:**"):
+                if role is not None:
+                    yield (role, "\n".join(content).strip())
+                role = "user"
+                content = [part[len("**User:**"):].lstrip()]
+            elif part.startswith("**Assistant:**"):
+                if role is not None:
+                    yield (role, "\n".join(content).strip())
+                role = "assistant"
+                content = [part[len("**Assistant:**"):].lstrip()]
+            elif role is not None:
+                content.append(part)
+    if role is not None:
+        yield (role, "\n".join(content).strip())
+
+
+_PIECES = [
+    "Some text here.", "More words and sentences. " * 3, "a[i", "[", "]",
+    "[link](http://example.com/path)", "[`run.py`](src/run.py)",
+    "[Tool output and ", "[`a`b](u)", "[[x](y)](z)", "`", "```",
+    "```py\ncode line\n```", "- bullet", "* bullet", "• bullet",
+    "  - nested", "-no space", "\n", "\n\n", "\n\n\n\n", "\n\n[next",
+    "\n\n*Tools used*", "Result: again",
+]
+
+
+def _fuzz_results(count, seed=1234):
+    rng = random.Random(seed)
+    for _ in range(count):
+        parts = [rng.choice(_PIECES) + rng.choice(('', ' ', '\n'))
+                 for _ in range(rng.randint(1, 300))]
+        yield "Result: " + "".join(parts)
+
+
+class CompletionResultTest(unittest.TestCase):
+    def assertMatchesReference(self, content):
+        self.assertEqual(extract_prompts.extract_completion_result(content),
+                         reference_completion_result(content))
+
+    def test_no_result(self):
+        self.assertIsNone(
+            extract_prompts.extract_completion_result("no marker here"))
+
+    def test_stray_bracket_before_code_link(self):
+        self.assertMatchesReference(
+            "Result: Updated [Tool output and [`run.py`](run.py)")
+        self.assertMatchesReference(
+            "Result: fixed a[i\nsee [`run.py`](src/run.py)")
+
+    def test_long_bullet_list_is_counted_in_full(self):
+        content = ("Result: Done.\n"
+                   + "".join(f"- item {i}\n" for i in range(200))
+                   + "Conclusion: all good.")
+        result = extract_prompts.extract_completion_result(content)
+        self.assertIn("*(... 195 more items)*", result)
+        self.assertIn("Conclusion: all good.", result)
+        self.assertMatchesReference(content)
+
+    def test_link_heavy_result(self):
+        self.assertMatchesReference(
+            "Result: " + ("[a](http://example.com/" + "x" * 40 + ") ") * 200)
+
+    def test_matches_reference_on_fuzzed_results(self):
+        for content in _fuzz_results(3000):
+            self.assertMatchesReference(content)
+
+
+_HISTORY_PIECES = [
+    "**User:**", "**Assistant:**", "---", "--- ", "---\t", "---\x0c",
+    "----", " ---", "a---", "text", "\u00e9t\u00e9", "<task>x</task>",
+    "Result: done", "",
+]
+_NEWLINES = ["\n", "\r\n", "\r", "\r\r\n", "\n\r"]
+
+
+class IterMessagesTest(unittest.TestCase):
+    def test_matches_text_mode_reader(self):
+        rng = random.Random(99)
+        with tempfile.TemporaryDirectory() as tmp:
+            path = os.path.join(tmp, "history.md")
+            for _ in range(400):
+                text = "".join(rng.choice(_HISTORY_PIECES) + rng.choice(_NEWLINES)
+                               for _ in range(rng.randint(1, 60)))
+                with open(path, 'w', encoding='utf-8', newline='') as f:
+                    f.write(text)
+                self.assertEqual(list(extract_prompts.iter_messages(path)),
+                                 list(reference_iter_messages(path)), repr(text))
+
+
+if __name__ == '__main__':
+    unittest.main()
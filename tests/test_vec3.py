@@ -0,0 +1,25 @@
+import math
+import os
+import sys
+import unittest
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import run  # noqa: E402
+
+
+class Vec3NormalizeTest(unittest.TestCase):
+    def test_unit_length(self):
+        n = run.Vec3(1, 2, 3).normalize()
+        inv = 1.0 / math.sqrt(14)
+        self.assertAlmostEqual(n.x, inv)
+        self.assertAlmostEqual(n.y, 2 * inv)
+        self.assertAlmostEqual(n.z, 3 * inv)
+
+    def test_zero_vector(self):
+        n = run.Vec3(0, 0, 0).normalize()
+        self.assertEqual((n.x, n.y, n.z), (0, 0, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()